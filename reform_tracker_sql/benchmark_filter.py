@@ -0,0 +1,70 @@
+import re
+import string
+import time
+from itertools import islice
+
+from helper import spacy_resource, get_collection, load_nlp, split_sentences, get_stop_words, get_keyword_filter
+
+# Speed and parity of the compiled keyword filter against the per-token filter it replaced, on sentences of
+# the first _sample_frs FRs that are parsed once up front so only the filtering itself is timed
+_nlp_model = 'en_core_web_lg'
+_sample_frs = 1000
+_runs = 5
+
+
+def reference_filter_keywords(doc):
+    stop_words = get_stop_words()
+    excluded_tags = {"DET", "ADP", "CCONJ", "SCONJ"}
+    punctuation_and_symbols = set(string.punctuation)
+    keywords = [
+        token.lemma_.lower() for token in doc
+        if token.pos_ not in excluded_tags
+           and token.lemma_.lower() not in stop_words
+           and not token.text.endswith(("ing", "en", "ed", "ly", "ry", "es"))
+           and not token.is_stop
+           and token.text not in punctuation_and_symbols
+           and not token.text.isdigit()
+           and not re.match(r'^[\[\]{}()<>]$', token.text)
+    ]
+    return [keyword.lower() for keyword in keywords]
+
+
+def run(filter_function, docs):
+    timings = []
+    keywords = []
+    for _ in range(_runs):
+        start = time.perf_counter()
+        keywords = [filter_function(doc) for doc in docs]
+        timings.append(time.perf_counter() - start)
+    return keywords, min(timings)
+
+
+spacy_resource(_nlp_model)
+
+batches = get_collection(stream=True)
+frs = list(islice((fr for _, _, _, frs in batches for fr in frs), _sample_frs))
+batches.close()
+sentences = [
+    sentence for fr in frs for text in (fr.get_finding(), fr.get_recommendation()) for sentence in split_sentences(text)
+]
+
+nlp = load_nlp(_nlp_model, minimal=True)
+docs = list(nlp.pipe(sentences, batch_size=256))
+tokens = sum(len(doc) for doc in docs)
+
+start = time.perf_counter()
+keyword_filter = get_keyword_filter(nlp.vocab)
+print(f"Compiled the filter in {(time.perf_counter() - start) * 1000:.1f} ms for {len(nlp.vocab)} lexemes")
+
+expected, reference_time = run(reference_filter_keywords, docs)
+actual, compiled_time = run(keyword_filter, docs)
+matching = sum(1 for e, a in zip(expected, actual) if e == a)
+print(f"Reference filter: {reference_time * 1e9 / max(tokens, 1):.0f} ns per token ({tokens} tokens)")
+print(
+    f"Compiled filter:  {compiled_time * 1e9 / max(tokens, 1):.0f} ns per token, "
+    f"speedup x{reference_time / max(compiled_time, 1e-9):.2f}, "
+    f"identical keywords for {matching}/{len(docs)} sentences"
+)
+print(f"Compiled filter memo over {_runs} runs: {keyword_filter.stats()}")
+for doc, e, a in islice(((d, e, a) for d, e, a in zip(docs, expected, actual) if e != a), 3):
+    print(f"  differs: {doc.text[:80]!r}\n    reference: {e}\n    compiled:  {a}")
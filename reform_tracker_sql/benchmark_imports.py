@@ -0,0 +1,51 @@
+import statistics
+import subprocess
+import sys
+
+# Startup import cost of every entry point, measured in fresh interpreters, against importing every helper
+# submodule up front as the single helper.py module used to
+_runs = 5
+_heavy_modules = ["spacy", "nltk", "sqlalchemy", "wordcloud", "matplotlib", "requests", "typer"]
+
+entry_points = {
+    "all helper submodules (eager)": "import helper.charts, helper.db, helper.incremental, helper.nlp, helper.resources",
+    "generate_categories_graph.py": "from helper import generate_category_chart; import keyword_store",
+    "generate_climate_ts.py": "from helper import generate_ts; import keyword_store, term_cube",
+    "generate_wordclouds.py": "from helper import nltk_resources, create_word_cloud_from_counts; import term_matrix",
+    "generate_keywords.py": (
+        "from helper import spacy_resource, get_collection, extract_keywords_cached, load_nlp, "
+        "getCountryYearCriteriaWatermarks, load_watermarks, save_atomic; import keyword_store, term_matrix"
+    )
+}
+
+_probe = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed, ",".join(name for name in {heavy!r} if name in sys.modules))
+"""
+
+
+def measure(statement):
+    timings = []
+    loaded = ""
+    for _ in range(_runs):
+        output = subprocess.run(
+            [sys.executable, "-c", _probe.format(statement=statement, heavy=_heavy_modules)],
+            check=True, capture_output=True, text=True
+        ).stdout.split()
+        timings.append(float(output[0]))
+        loaded = output[1] if len(output) > 1 else ""
+    return statistics.median(timings), loaded
+
+
+if __name__ == "__main__":
+    baseline = None
+    for label, statement in entry_points.items():
+        elapsed, loaded = measure(statement)
+        baseline = baseline or elapsed
+        print(
+            f"{label:<32} {elapsed * 1000:>8.0f} ms  speedup x{baseline / max(elapsed, 1e-9):<5.1f} "
+            f"loads: {loaded or '-'}"
+        )
@@ -0,0 +1,39 @@
+import time
+from itertools import islice
+
+from helper import spacy_resource, get_collection, load_nlp, extract_keywords_batch
+
+# Keyword parity and speed of the minimal pipeline against the full one on the first _sample_frs FRs
+_nlp_model = 'en_core_web_lg'
+_sample_frs = 1000
+
+spacy_resource(_nlp_model)
+
+batches = get_collection(stream=True)
+frs = list(islice((fr for _, _, _, frs in batches for fr in frs), _sample_frs))
+batches.close()
+texts = [text for fr in frs for text in (fr.get_finding(), fr.get_recommendation())]
+
+
+def run(nlp, regex_split):
+    start = time.perf_counter()
+    keywords = extract_keywords_batch(nlp, texts, regex_split=regex_split)
+    return keywords, time.perf_counter() - start
+
+
+full_keywords, full_time = run(load_nlp(_nlp_model), True)
+print(f"Full pipeline, regex sentences: {full_time * 1000 / max(len(frs), 1):.2f}s per 1k FRs")
+
+minimal_nlp = load_nlp(_nlp_model, minimal=True)
+print(f"Minimal pipeline components: {', '.join(minimal_nlp.pipe_names)}")
+for label, regex_split in (("regex sentences", True), ("whole texts", False)):
+    keywords, elapsed = run(minimal_nlp, regex_split)
+    matching = sum(1 for expected, actual in zip(full_keywords, keywords) if expected == actual)
+    print(
+        f"Minimal pipeline, {label}: {elapsed * 1000 / max(len(frs), 1):.2f}s per 1k FRs, "
+        f"speedup x{full_time / max(elapsed, 1e-9):.2f}, "
+        f"identical keywords for {matching}/{len(texts)} texts"
+    )
+    for text, expected, actual in islice(
+            ((t, e, a) for t, e, a in zip(texts, full_keywords, keywords) if e != a), 3):
+        print(f"  differs: {text[:80]!r}\n    full:    {expected}\n    minimal: {actual}")
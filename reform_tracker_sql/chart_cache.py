@@ -0,0 +1,76 @@
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+# part of every key: bump it when a change to the render code in helper/charts.py (colors, layout, fonts...)
+# should re-render the charts that are already on disk
+CHART_CACHE_VERSION = 1
+
+
+class ChartCache:
+    # remembers, next to every rendered chart, a hash of the data and parameters it was rendered from;
+    # the key of each chart lives in <output_dir>/.chart_cache/<chart file>.json so parallel renders
+    # never write the same file
+    directory = ".chart_cache"
+
+    def __init__(self, force: bool = False):
+        self.force = force
+        self.skipped = 0
+        self.rendered = 0
+        self._fingerprints = {}
+
+    def fingerprint(self, source):
+        # hashed once per object and run; the object is kept so its id cannot be reused
+        if source is None:
+            return None
+        cached = self._fingerprints.get(id(source))
+        if cached is None:
+            if isinstance(source, pd.DataFrame):
+                digest = hashlib.sha256(json.dumps(list(source.columns)).encode("utf-8"))
+                digest.update(pd.util.hash_pandas_object(source, index=False).to_numpy().tobytes())
+                cached = (source, digest.hexdigest())
+            else:
+                cached = (source, source.fingerprint())
+            self._fingerprints[id(source)] = cached
+        return cached[1]
+
+    def key(self, function, source, params):
+        payload = json.dumps(
+            [CHART_CACHE_VERSION, function, self.fingerprint(source), params], sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _entry(self, filename):
+        folder, name = os.path.split(filename)
+        return os.path.join(folder, self.directory, f"{name}.json")
+
+    def is_fresh(self, filename, key):
+        if self.force or not os.path.exists(filename):
+            return False
+        try:
+            with open(self._entry(filename), "r", encoding="utf-8") as file:
+                fresh = json.load(file).get("key") == key
+        except (OSError, ValueError):
+            return False
+        if fresh:
+            self.skipped += 1
+            print(f"Up to date: {filename}")
+        return fresh
+
+    def record(self, filename, key):
+        entry = self._entry(filename)
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        with open(f"{entry}.tmp", "w", encoding="utf-8") as file:
+            json.dump({"key": key}, file)
+        os.replace(f"{entry}.tmp", entry)
+        self.rendered += 1
+
+    def merge(self, stats):
+        # counts of a worker process, which renders with its own copy of the cache
+        self.rendered += stats["rendered"]
+        self.skipped += stats["skipped"]
+
+    def stats(self):
+        return {"rendered": self.rendered, "skipped": self.skipped}
@@ -6,3 +6,9 @@ DB_USER_NAME = "root"   # default root
 DB_USER_PASSWORD = ""   # default None
 DB_HOST = "127.0.0.1"   # default 127.0.0.1 or localhost
 DB_PORT = "3306"        # default 3306
+
+# DB CONNECTION POOL
+DB_POOL_SIZE = 5            # connections kept open in the pool
+DB_MAX_OVERFLOW = 10        # extra connections allowed when the pool is exhausted
+DB_POOL_PRE_PING = True     # check a connection is alive before handing it out
+DB_POOL_RECYCLE = 3600      # seconds before a pooled connection is replaced
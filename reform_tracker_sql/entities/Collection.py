@@ -1,40 +1,48 @@
-import copy
+from entities.Criteria import Criteria
+from entities.FindingRecommendationTable import FindingRecommendationView
+from entities.Year import Year
 
 
 class Collection:
+    __slots__ = ("countries", "_years", "_criteria", "_frs", "_total_years", "_total_criteria", "_total_frs")
+
     def __init__(self, countries: list):
-        self.countries = countries
+        self.countries = tuple(countries)
+        self._years = None
+        self._criteria = None
+        self._frs = None
+        self._total_years = len({year.id for country in self.countries for year in country.years})
+        self._total_criteria = len({
+            _criteria.id for country in self.countries for year in country.years for _criteria in year.criteria
+        })
+        self._total_frs = sum(country.total_frs() for country in self.countries)
 
     def get_countries(self):
         return list(self)
 
     def get_years(self):
-        years = {}
-        for country in self.countries:
-            for year in country.years:
-                if year.id not in years:
-                    years[year.id] = copy.deepcopy(year)
-                else:
-                    years[year.id].criteria.extend(copy.deepcopy(year.criteria))
-        return list(years.values())
+        if self._years is None:
+            grouped = {}
+            for country in self.countries:
+                for year in country.years:
+                    if year.id not in grouped:
+                        grouped[year.id] = (year.name, [])
+                    grouped[year.id][1].append(year.criteria)
+            self._years = {
+                _id: Year(_id, name, tuple(_criteria for criteria in criteria_lists for _criteria in criteria))
+                for _id, (name, criteria_lists) in grouped.items()
+            }
+        return list(self._years.values())
 
     def get_criteria(self):
-        years = self.get_years()
-        criteria = {}
-        for year in years:
-            for _criteria in year.criteria:
-                if _criteria.id not in criteria:
-                    criteria[_criteria.id] = copy.deepcopy(_criteria)
-                else:
-                    criteria[_criteria.id].frs.extend(copy.deepcopy(_criteria.frs))
-        return list(criteria.values())
+        if self._criteria is None:
+            self._criteria = Criteria.merge(_criteria for year in self.get_years() for _criteria in year.criteria)
+        return list(self._criteria.values())
 
     def get_frs(self):
-        frs = []
-        criteria = self.get_criteria()
-        for _criteria in criteria:
-            frs.extend(copy.deepcopy(_criteria.frs))
-        return frs
+        if self._frs is None:
+            self._frs = FindingRecommendationView.concat(_criteria.frs for _criteria in self.get_criteria())
+        return list(self._frs)
 
     def total_document(self):
         td = 0
@@ -46,13 +54,13 @@ class Collection:
         return len(self.countries)
 
     def total_years(self):
-        return len(self.get_years())
+        return self._total_years
 
     def total_criteria(self):
-        return len(self.get_criteria())
+        return self._total_criteria
 
     def total_frs(self):
-        return len(self.get_frs())
+        return self._total_frs
 
     def __repr__(self):
         return f"Total Countries: {len(self)}"
@@ -1,11 +1,19 @@
-import copy
+from entities.Criteria import Criteria
+from entities.FindingRecommendationTable import FindingRecommendationView
 
 
 class Country:
+    __slots__ = ("id", "name", "years", "_criteria", "_frs", "_total_criteria", "_total_frs")
+
     def __init__(self, _id: int, name: str, years: list):
         self.id = _id
         self.name = name
-        self.years = years
+        # a tuple, so the counts cached below cannot go stale
+        self.years = tuple(years)
+        self._criteria = None
+        self._frs = None
+        self._total_criteria = len({_criteria.id for year in self.years for _criteria in year.criteria})
+        self._total_frs = sum(year.total_frs() for year in self.years)
 
     def get_years(self):
         return list(self)
@@ -17,22 +25,14 @@ class Country:
         return self.id
 
     def get_criteria(self):
-        years = self.years
-        criteria = {}
-        for year in years:
-            for _criteria in year.criteria:
-                if _criteria.id not in criteria:
-                    criteria[_criteria.id] = copy.deepcopy(_criteria)
-                else:
-                    criteria[_criteria.id].frs.extend(copy.deepcopy(_criteria.frs))
-        return list(criteria.values())
+        if self._criteria is None:
+            self._criteria = Criteria.merge(_criteria for year in self.years for _criteria in year.criteria)
+        return list(self._criteria.values())
 
     def get_frs(self):
-        frs = []
-        criteria = self.get_criteria()
-        for _criteria in criteria:
-            frs.extend(copy.deepcopy(_criteria.frs))
-        return frs
+        if self._frs is None:
+            self._frs = FindingRecommendationView.concat(_criteria.frs for _criteria in self.get_criteria())
+        return list(self._frs)
 
     def total_document(self):
         return len(self.years)
@@ -41,10 +41,10 @@ class Country:
         return len(self.years)
 
     def total_criteria(self):
-        return len(self.get_criteria())
+        return self._total_criteria
 
     def total_frs(self):
-        return len(self.get_frs())
+        return self._total_frs
 
     def __repr__(self):
         return f"Country: {self.name}\nTotal Years: {len(self)}"
@@ -1,8 +1,14 @@
+from entities.FindingRecommendationTable import FindingRecommendationView
+
+
 class Criteria:
+    __slots__ = ("id", "title", "frs")
+
     def __init__(self, _id: int, title: str, frs: list):
         self.id = _id
         self.title = title
-        self.frs = frs
+        # views are read-only already, anything else is frozen into a tuple
+        self.frs = frs if isinstance(frs, FindingRecommendationView) else tuple(frs)
 
     def get_frs(self):
         return list(self)
@@ -27,3 +33,16 @@ class Criteria:
 
     def __len__(self):
         return len(self.frs)
+
+    @staticmethod
+    def merge(criteria):
+        # id -> read-only Criteria view sharing the original FindingRecommendation rows
+        grouped = {}
+        for _criteria in criteria:
+            if _criteria.id not in grouped:
+                grouped[_criteria.id] = (_criteria.title, [])
+            grouped[_criteria.id][1].append(_criteria.frs)
+        return {
+            _id: Criteria(_id, title, FindingRecommendationView.concat(frs_lists))
+            for _id, (title, frs_lists) in grouped.items()
+        }
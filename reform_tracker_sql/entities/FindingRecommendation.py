@@ -1,4 +1,6 @@
 class FindingRecommendation:
+    __slots__ = ("id", "finding", "recommendation")
+
     def __init__(self, _id: int, finding: str, recommendation: str):
         self.id = _id
         self.finding = finding
@@ -0,0 +1,65 @@
+import numpy as np
+
+from entities.FindingRecommendation import FindingRecommendation
+
+
+class FindingRecommendationTable:
+    __slots__ = ("ids", "findings", "recommendations")
+
+    def __init__(self):
+        self.ids = []
+        self.findings = []
+        self.recommendations = []
+
+    def append(self, _id: int, finding: str, recommendation: str):
+        self.ids.append(_id)
+        self.findings.append(finding)
+        self.recommendations.append(recommendation)
+        return len(self.ids) - 1
+
+    def freeze(self):
+        self.ids = np.asarray(self.ids, dtype=np.int64)
+        return self
+
+    def view(self, start: int, stop: int):
+        return FindingRecommendationView(self, range(start, stop))
+
+    def row(self, index: int):
+        return FindingRecommendation(int(self.ids[index]), self.findings[index], self.recommendations[index])
+
+    def __len__(self):
+        return len(self.ids)
+
+
+class FindingRecommendationView:
+    # read-only sequence of table rows; FindingRecommendation objects are only built on access
+    __slots__ = ("table", "rows")
+
+    def __init__(self, table: FindingRecommendationTable, rows):
+        self.table = table
+        self.rows = rows
+
+    @staticmethod
+    def concat(sequences):
+        sequences = list(sequences)
+        if sequences and all(isinstance(seq, FindingRecommendationView) for seq in sequences) \
+                and len({id(seq.table) for seq in sequences}) == 1:
+            if len(sequences) == 1:
+                return sequences[0]
+            return FindingRecommendationView(
+                sequences[0].table,
+                np.concatenate([np.asarray(seq.rows, dtype=np.int64) for seq in sequences])
+            )
+        return tuple(fr for seq in sequences for fr in seq)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return FindingRecommendationView(self.table, self.rows[index])
+        return self.table.row(self.rows[index])
+
+    def __iter__(self):
+        for index in self.rows:
+            yield self.table.row(index)
+
+    def __len__(self):
+        return len(self.rows)
@@ -1,11 +1,16 @@
-import copy
+from entities.FindingRecommendationTable import FindingRecommendationView
 
 
 class Year:
+    __slots__ = ("id", "name", "criteria", "_frs", "_total_frs")
+
     def __init__(self, _id: int, name: str, criteria: list):
         self.id = _id
         self.name = name
-        self.criteria = criteria
+        # a tuple, so the count cached below cannot go stale
+        self.criteria = tuple(criteria)
+        self._frs = None
+        self._total_frs = sum(len(_criteria) for _criteria in self.criteria)
 
     def get_criteria(self):
         return list(self)
@@ -17,17 +22,15 @@ class Year:
         return self.id
 
     def get_frs(self):
-        frs = []
-        criteria = self.criteria
-        for _criteria in criteria:
-            frs.extend(copy.deepcopy(_criteria.frs))
-        return frs
+        if self._frs is None:
+            self._frs = FindingRecommendationView.concat(_criteria.frs for _criteria in self.criteria)
+        return list(self._frs)
 
     def total_criteria(self):
-        return len(self.get_criteria())
+        return len(self.criteria)
 
     def total_frs(self):
-        return len(self.get_frs())
+        return self._total_frs
 
     def __repr__(self):
         return f"Year: {self.name}\nTotal Criteria: {len(self)}"
@@ -0,0 +1,23 @@
+import argparse
+
+from helper import fetch_resources
+
+parser = argparse.ArgumentParser(description="Download the NLTK data and spaCy models the scripts need, in parallel")
+parser.add_argument(
+    "--mirror", help="directory, file:// or http(s) URL with nltk_data/ and spacy_models/ to install from, "
+                     "defaults to $RESOURCE_MIRROR or the public sources"
+)
+parser.add_argument("--workers", type=int, default=4, help="concurrent downloads")
+args = parser.parse_args()
+
+nltk_data = [
+    'corpora/stopwords',
+    'tokenizers/punkt',
+    'corpora/wordnet',
+    'taggers/averaged_perceptron_tagger',
+    'chunkers/maxent_ne_chunker',
+    'corpora/words'
+]
+spacy_models = ['en_core_web_lg']
+
+fetch_resources(nltk_resources=nltk_data, spacy_models=spacy_models, mirror=args.mirror, workers=args.workers)
@@ -1,14 +1,20 @@
+import argparse
 import os
 
-import pandas as pd
-
+from chart_cache import ChartCache
 from helper import generate_category_chart
+from keyword_store import load_keyword_store
+
+parser = argparse.ArgumentParser(description="Render the recommendation category charts into ./output/categories_charts")
+parser.add_argument("--force", action="store_true", help="render every chart, even the ones that are up to date")
+args = parser.parse_args()
+chart_cache = ChartCache(force=args.force)
 
 output_dir = "./output/categories_charts"
 os.makedirs(output_dir, exist_ok=True)
 
-filename = "oecd_keywords_df.pkl"
-df_collection = pd.read_pickle(filename)
+store_path = "oecd_keywords"
+df_collection = load_keyword_store(store_path, columns=["recommendations", "recommendations_count", "year_entries"])
 
 # --------- EUROPE ---------
 generate_category_chart(
@@ -16,7 +22,8 @@ generate_category_chart(
     end_year=2010,
     countries="Europe",
     output_dir=output_dir,
-    df=df_collection
+    df=df_collection,
+    cache=chart_cache
 )
 
 generate_category_chart(
@@ -24,7 +31,8 @@ generate_category_chart(
     end_year=2023,
     countries="Europe",
     output_dir=output_dir,
-    df=df_collection
+    df=df_collection,
+    cache=chart_cache
 )
 
 # --------- ASIA ---------
@@ -33,7 +41,8 @@ generate_category_chart(
     end_year=2010,
     countries="Asia",
     output_dir=output_dir,
-    df=df_collection
+    df=df_collection,
+    cache=chart_cache
 )
 
 generate_category_chart(
@@ -41,7 +50,8 @@ generate_category_chart(
     end_year=2023,
     countries="Asia",
     output_dir=output_dir,
-    df=df_collection
+    df=df_collection,
+    cache=chart_cache
 )
 
 # --------- AMERICA ---------
@@ -50,7 +60,8 @@ generate_category_chart(
     end_year=2010,
     countries="America",
     output_dir=output_dir,
-    df=df_collection
+    df=df_collection,
+    cache=chart_cache
 )
 
 generate_category_chart(
@@ -58,7 +69,8 @@ generate_category_chart(
     end_year=2023,
     countries="America",
     output_dir=output_dir,
-    df=df_collection
+    df=df_collection,
+    cache=chart_cache
 )
 
 # -------- for SINGLE or MULTIPLE countries/region --------
@@ -72,7 +84,8 @@ generate_category_chart(
                         #       this will populate all the countries from America + Australia and Korea
                         #       as a list format: ["America", "Australia", "Korea"] populates same as previous
     output_dir=output_dir,
-    df=df_collection
+    df=df_collection,
+    cache=chart_cache
 )
 
 generate_category_chart(
@@ -80,6 +93,7 @@ generate_category_chart(
     end_year=2023,
     countries="Japan",
     output_dir=output_dir,
-    df=df_collection
+    df=df_collection,
+    cache=chart_cache
 )
-
+print(f"Chart cache: {chart_cache.stats()}")
@@ -0,0 +1,141 @@
+import argparse
+import inspect
+import json
+import multiprocessing
+import os
+import time
+
+import matplotlib
+import matplotlib.pyplot as plt
+
+import terms
+from chart_cache import ChartCache
+from helper import create_word_cloud_from_counts, generate_ts, generate_category_chart
+from helper import get_wc_filename, get_ts_filename, get_chart_filename, get_render_profile, profile_filename
+from keyword_store import load_keyword_store
+from term_cube import TermCube
+
+parser = argparse.ArgumentParser(description="Render the chart jobs of a JSON spec from one load of the keyword store")
+parser.add_argument("spec", nargs="?", default="chart_jobs.json", help="JSON file with the chart jobs")
+parser.add_argument("--profile", help="render profile for jobs without one (preview, web or print)")
+parser.add_argument("--force", action="store_true", help="render every chart, even the ones that are up to date")
+parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1), help="rendering processes")
+args = parser.parse_args()
+
+store_path = "oecd_keywords"
+cube_path = "oecd_term_cube"
+_output_dirs = {
+    "word_cloud": "./output/word_clouds",
+    "time_series": "./output/time_series",
+    "categories": "./output/categories_charts"
+}
+
+# the function that renders every kind of job; a job's keys other than "chart" are its keyword arguments
+_chart_functions = {
+    "word_cloud": create_word_cloud_from_counts,
+    "time_series": generate_ts,
+    "categories": generate_category_chart
+}
+# passed by the runner itself, not by the jobs
+_runner_parameters = {"source", "df", "cube", "cache"}
+
+_df = None
+_cube = None
+_cache = None
+
+
+def init_worker(df, cube, cache):
+    # every worker renders off-screen with its own pyplot state; df and cube are shared once per worker
+    global _df, _cube, _cache
+    matplotlib.use("Agg")
+    _df = df
+    _cube = cube
+    _cache = cache
+
+
+def job_filename(job):
+    countries = job.get("countries")
+    if job["chart"] == "word_cloud":
+        filename = get_wc_filename(job["column"], job["start_year"], job["end_year"], countries)
+    elif job["chart"] == "time_series":
+        filename = get_ts_filename(job["relevancy"], job["start_year"], job["end_year"], countries)
+    else:
+        filename = get_chart_filename(job["start_year"], job["end_year"], countries)
+    return profile_filename(filename, get_render_profile(job.get("profile")))
+
+
+def check_job(index, job):
+    # a key the chart function does not take would only fail once the job runs, or be mistaken for a
+    # create_word_cloud option such as collocations; stop before anything is loaded instead
+    function = _chart_functions.get(job.get("chart"))
+    if function is None:
+        parser.error(f"job {index} has chart {job.get('chart')!r}, expected one of {', '.join(_chart_functions)}")
+    unknown = set(job) - {"chart"} - (set(inspect.signature(function).parameters) - _runner_parameters)
+    if unknown:
+        parser.error(f"job {index} ({job['chart']}) has parameters {function.__name__} does not take: "
+                     f"{', '.join(sorted(unknown))}")
+
+
+def job_cache_stats(before):
+    # what this job added to the worker's cache counters, merged into the parent's cache afterwards
+    return {name: count - before[name] for name, count in _cache.stats().items()}
+
+
+def render(job):
+    job = dict(job)
+    chart = job.pop("chart")
+    job.setdefault("output_dir", _output_dirs[chart])
+    os.makedirs(job["output_dir"], exist_ok=True)
+    start = time.perf_counter()
+    counts = _cache.stats()
+    try:
+        with matplotlib.rc_context():
+            if chart == "word_cloud":
+                create_word_cloud_from_counts(source=_df, cache=_cache, **job)
+            elif chart == "time_series":
+                # terms are named after their list in terms.py, e.g. "climate_related_terms"
+                job["related_terms"] = getattr(terms, job["related_terms"])
+                if "figsize" in job:
+                    job["figsize"] = tuple(job["figsize"])
+                generate_ts(df=_df, cube=_cube, cache=_cache, **job)
+            else:
+                generate_category_chart(df=_df, cache=_cache, **job)
+        return time.perf_counter() - start, None, job_cache_stats(counts)
+    except Exception as e:
+        return time.perf_counter() - start, f"{type(e).__name__}: {e}", job_cache_stats(counts)
+    finally:
+        plt.close("all")
+
+
+if __name__ == "__main__":
+    with open(args.spec, "r", encoding="utf-8") as file:
+        spec = json.load(file)
+    # a job's own profile wins over --profile, which wins over the profile of the spec
+    profile = args.profile or spec.get("profile")
+    jobs = [{"profile": profile, **job} if profile else job for job in spec["jobs"]]
+    for index, job in enumerate(jobs):
+        check_job(index, job)
+
+    start = time.perf_counter()
+    df = load_keyword_store(store_path)
+    cube = TermCube.load(cube_path) if os.path.exists(f"{cube_path}.npz") else None
+    # fingerprinted before the pool starts so the workers inherit the hashes
+    cache = ChartCache(force=args.force)
+    cache.fingerprint(df)
+    cache.fingerprint(cube)
+    load_time = time.perf_counter() - start
+    print(f"Loaded {len(df)} country-years from {store_path} in {load_time:.2f}s")
+
+    # forked workers inherit df and the cube instead of unpickling a copy per job
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    with context.Pool(max(1, args.workers), initializer=init_worker, initargs=(df, cube, cache)) as pool:
+        results = pool.map(render, jobs, chunksize=1)
+
+    print(f"\n{'chart':<12} {'seconds':>8}  output")
+    for job, (elapsed, error, job_stats) in zip(jobs, results):
+        cache.merge(job_stats)
+        print(f"{job['chart']:<12} {elapsed:>8.2f}  {job_filename(job)}{f'  FAILED {error}' if error else ''}")
+    failed = sum(1 for _, error, _ in results if error)
+    print(f"{len(jobs) - failed}/{len(jobs)} charts in {time.perf_counter() - start:.2f}s (load {load_time:.2f}s)")
+    print(f"Chart cache: {cache.stats()}")
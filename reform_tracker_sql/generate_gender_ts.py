@@ -1,15 +1,27 @@
+import argparse
 import os
 
-import pandas as pd
-
+from chart_cache import ChartCache
 from helper import generate_ts
+from keyword_store import load_keyword_store
+from term_cube import TermCube
 from terms import gender_related_terms
 
+parser = argparse.ArgumentParser(description="Render the gender time series into ./output/time_series")
+parser.add_argument("--force", action="store_true", help="render every chart, even the ones that are up to date")
+args = parser.parse_args()
+chart_cache = ChartCache(force=args.force)
+
 output_dir = "./output/time_series"
 os.makedirs(output_dir, exist_ok=True)
 
-filename = "oecd_keywords_df.pkl"
-df_collection = pd.read_pickle(filename)
+store_path = "oecd_keywords"
+cube_path = "oecd_term_cube"
+cube = TermCube.load(cube_path) if os.path.exists(f"{cube_path}.npz") else None
+# the keyword store is only scanned when the cube is missing or was built from other terms
+df_collection = None
+if cube is None or not cube.has("gender", gender_related_terms):
+    df_collection = load_keyword_store(store_path, columns=["all", "all_terms_count", "year_entries"])
 
 # ------- ALL YEARS & COUNTRIES ---------
 generate_ts(
@@ -22,7 +34,9 @@ generate_ts(
     title="Gender-Related Terms Occurrences Over Time (2000-2023)",
     x_label="Count of Gender-Related Terms",
     y_label="Year",
-    output_dir=output_dir
+    output_dir=output_dir,
+    cube=cube,
+    cache=chart_cache
 )
 
 # ------- LIMITED YEAR & COUNTRIES/REGION --------
@@ -42,5 +56,8 @@ generate_ts(
     title="Japan Gender-Related Terms Occurrences Over Time (2000-2023)",
     x_label="Count of Gender-Related Terms",
     y_label="Year",
-    output_dir=output_dir
+    output_dir=output_dir,
+    cube=cube,
+    cache=chart_cache
 )
+print(f"Chart cache: {chart_cache.stats()}")
@@ -1,16 +1,81 @@
-import re
+import argparse
+import os
+from itertools import groupby
 
 import pandas as pd
-import spacy
 from tqdm import tqdm
 
-from helper import spacy_resource, get_collection, extract_keywords
+from helper import spacy_resource, get_collection, extract_keywords_cached, load_nlp, keyword_cache_fingerprint
+from helper import get_keyword_filter
+from helper import getCountryYearCriteriaWatermarks, load_watermarks, save_watermarks, diff_watermarks
+from helper import merge_keyword_frames, order_keyword_frame
+from helper import load_checkpoint, open_checkpoint, write_checkpoint, save_atomic
+from keyword_cache import KeywordCache
+from keyword_store import write_keyword_store
+from term_cube import TermCube
+from term_matrix import TermMatrix
+
+parser = argparse.ArgumentParser(description="Extract keywords per country and year into oecd_keywords_df.pkl")
+parser.add_argument("--resume", action="store_true", help="skip the country-years an interrupted run already finished")
+args = parser.parse_args()
 
-collection = get_collection()
 _nlp_model = 'en_core_web_lg'
+_batch_size = 256
+# workers are forked from the loaded model and share it copy-on-write (helper.share_nlp_with_workers); the cap
+# is there because the main process feeds the sentences, filters the docs and reads the cache on its own,
+# so more workers mostly wait, and each one still copies the pages it writes (new lexemes, its docs)
+_n_process = min(4, os.cpu_count() or 1)
+_minimal_pipeline = False  # tagger + lemmatizer only, whole texts; check parity with benchmark_keywords.py first
+_cache_filename = "oecd_keywords_cache.sqlite"
+_cache_max_entries = 1000000
+_incremental = True  # only re-extract country-years whose rows changed since the last run
+_watermark_filename = "oecd_keywords_watermarks.json"
+filename = "oecd_keywords_df.pkl"
+store_path = "oecd_keywords"  # Parquet keyword store read by the chart scripts
+term_matrix_path = "oecd_term_counts"  # vocabulary + sparse (country, year, field) x term counts
+term_cube_path = "oecd_term_cube"  # climate/gender term counts per country-year for the time series
+checkpoint_filename = f"{filename}.checkpoint"
 
 spacy_resource(_nlp_model)
-nlp = spacy.load(_nlp_model)
+nlp = load_nlp(_nlp_model, minimal=_minimal_pipeline)
+
+
+def keyword_texts(batches):
+    for country, year, _criteria, frs in batches:
+        yield _criteria.get_title(), (country, year, "criteria")
+        for fr in frs:
+            yield fr.get_finding(), (country, year, "finding")
+            yield fr.get_recommendation(), (country, year, "recommendation")
+
+
+fingerprint = keyword_cache_fingerprint(nlp, regex_split=not _minimal_pipeline)
+watermarks = getCountryYearCriteriaWatermarks()
+previous = load_watermarks(_watermark_filename) if _incremental and os.path.exists(filename) else None
+if previous is not None and previous["fingerprint"] == fingerprint:
+    country_years, stale = diff_watermarks(previous["rows"], watermarks)
+    print(f"Incremental run: {len(country_years)} country-years changed since the last run")
+else:
+    country_years, stale = None, set()
+
+# a checkpoint is only reusable for the same keyword settings and the same database content
+checkpoint_fingerprint = KeywordCache.make_fingerprint(fingerprint, sorted(watermarks.items()))
+finished = load_checkpoint(checkpoint_filename, checkpoint_fingerprint) if args.resume else dict()
+if finished:
+    print(f"Resuming: {len(finished)} country-years already finished")
+checkpoint = open_checkpoint(checkpoint_filename, checkpoint_fingerprint, finished)
+
+target = {(mark[0], mark[1]) for mark in watermarks.values()} if country_years is None else country_years
+pending = None if country_years is None and not finished else target - set(finished)
+total_frs = sum(mark[5] for mark in watermarks.values() if (mark[0], mark[1]) in target)
+finished_frs = sum(mark[5] for mark in watermarks.values() if (mark[0], mark[1]) in finished)
+
+# batches arrive ordered by country, year and criteria, so each (country, year) is one consecutive group
+batches = get_collection(stream=True, country_years=pending)
+cache = KeywordCache(_cache_filename, fingerprint, max_entries=_cache_max_entries)
+results = extract_keywords_cached(
+    nlp, keyword_texts(batches), cache,
+    batch_size=_batch_size, n_process=_n_process, regex_split=not _minimal_pipeline
+)
 
 pd_data = {
     "country": [],
@@ -23,48 +88,65 @@ pd_data = {
     "all_terms_count": [],
     "year_entries": []
 }
+for row in finished.values():
+    for column, value in row.items():
+        pd_data[column].append(value)
 
 total_keywords = 0
 
-with tqdm(total=collection.total_frs(), desc="Processing Keywords") as pbar:
-    for country in collection.get_countries():
-        for year in country.get_years():
-            year_findings = []
-            year_recommendations = []
-            year_all = []
-            year_entry_count = 0
-            for _criteria in year.get_criteria():
-                criteria_findings_keywords = []
-                criteria_recommendations_keywords = []
-                criteria_all_keywords = extract_keywords(nlp, _criteria.get_title())
+with tqdm(total=total_frs, initial=finished_frs, desc="Processing Keywords") as pbar:
+    for (country, year), year_results in groupby(results, key=lambda result: result[1][:2]):
+        year_findings = []
+        year_recommendations = []
+        year_all = []
+        year_entry_count = 0
+        for keywords, (_, _, field) in year_results:
+            year_all += keywords
+            if field == "criteria":
                 year_entry_count += 1
-                for fr in _criteria.get_frs():
-                    finding_keywords = extract_keywords(nlp, fr.get_finding())
-                    recommendation_keywords = extract_keywords(nlp, fr.get_recommendation())
-                    criteria_findings_keywords += finding_keywords
-                    criteria_recommendations_keywords += recommendation_keywords
-                    criteria_all_keywords += finding_keywords
-                    criteria_all_keywords += recommendation_keywords
-                    year_entry_count += 1
-                    pbar.update(1)
-                # -----------------------------------------
-                year_findings += criteria_findings_keywords
-                year_recommendations += criteria_recommendations_keywords
-                year_all += criteria_all_keywords
-            # ----------------------------------------------
-            total_keywords += len(year_all)
-            pd_data["country"].append(country.get_name())
-            pd_data["year"].append(year.get_name())
-            pd_data["findings"].append(" ".join(year_findings))
-            pd_data["recommendations"].append(" ".join(year_recommendations))
-            pd_data["all"].append(" ".join(year_all))
-            pd_data["findings_count"].append(len(year_findings))
-            pd_data["recommendations_count"].append(len(year_recommendations))
-            pd_data["all_terms_count"].append(len(year_all))
-            pd_data["year_entries"].append(year_entry_count)
+            elif field == "finding":
+                year_findings += keywords
+                year_entry_count += 1
+            else:
+                year_recommendations += keywords
+                pbar.update(1)
+        # ----------------------------------------------
+        total_keywords += len(year_all)
+        row = {
+            "country": country.get_name(),
+            "year": year.get_name(),
+            "findings": " ".join(year_findings),
+            "recommendations": " ".join(year_recommendations),
+            "all": " ".join(year_all),
+            "findings_count": len(year_findings),
+            "recommendations_count": len(year_recommendations),
+            "all_terms_count": len(year_all),
+            "year_entries": year_entry_count
+        }
+        for column, value in row.items():
+            pd_data[column].append(value)
+        # commit the cache writes first, so a crash after the checkpoint loses none of the extracted keywords
+        cache.flush()
+        write_checkpoint(checkpoint, country.get_id(), year.get_id(), row)
 
-filename = "oecd_keywords_df.pkl"
+checkpoint.close()
+cache.flush()
+print(f"Keyword cache {_cache_filename}: {cache.stats()}")
+cache.close()
+# memo hits and misses of the keyword filter, and the tokens its lexeme flag dropped before the memo
+print(f"Keyword filter memo: {get_keyword_filter(nlp.vocab).stats()}")
+
+order = list(dict.fromkeys((mark[2], mark[3]) for mark in watermarks.values()))
 df = pd.DataFrame(pd_data)
-df.to_pickle(filename)
+if country_years is not None:
+    df = merge_keyword_frames(pd.read_pickle(filename), df, stale, order)
+else:
+    df = order_keyword_frame(df, order)
+save_atomic(filename, df.to_pickle)
+write_keyword_store(df, store_path)
+TermMatrix.from_frame(df).save(term_matrix_path)
+TermCube.from_frame(df).save(term_cube_path)
+save_watermarks(_watermark_filename, fingerprint, watermarks)
+os.remove(checkpoint_filename)
 
-print(f"Total Keyword Extracted: {total_keywords} and stored as {filename}")
+print(f"Total Keyword Extracted: {total_keywords} and stored as {filename} and {store_path}")
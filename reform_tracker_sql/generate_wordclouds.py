@@ -1,8 +1,14 @@
+import argparse
 import os
 
-import pandas as pd
+from chart_cache import ChartCache
+from helper import nltk_resources, create_word_cloud_from_counts
+from term_matrix import TermMatrix
 
-from helper import nltk_resources, create_word_cloud
+parser = argparse.ArgumentParser(description="Render the word clouds into ./output/word_clouds")
+parser.add_argument("--force", action="store_true", help="render every chart, even the ones that are up to date")
+args = parser.parse_args()
+chart_cache = ChartCache(force=args.force)
 
 nltk_resources([
     'corpora/stopwords',
@@ -17,73 +23,80 @@ nltk_resources([
 output_dir = "./output/word_clouds"
 os.makedirs(output_dir, exist_ok=True)
 
-filename = "oecd_keywords_df.pkl"
-df_collection = pd.read_pickle(filename)
+# word clouds are laid out from the term counts saved by generate_keywords.py, not from the joined keywords
+term_matrix_path = "oecd_term_counts"
+term_matrix = TermMatrix.load(term_matrix_path)
 
 # ---------------  RECOMMENDATIONS  ----------------------------
-create_word_cloud(
-    df=df_collection,
+create_word_cloud_from_counts(
+    source=term_matrix,
     start_year=2000,
     end_year=2010,
     column="recommendations",
     color="blue",
     title="Recommendations Word Cloud (2000-2010)",
-    output_dir=output_dir
+    output_dir=output_dir,
+    cache=chart_cache
 )
 
-create_word_cloud(
-    df=df_collection,
+create_word_cloud_from_counts(
+    source=term_matrix,
     start_year=2011,
     end_year=2023,
     column="recommendations",
     color="orange",
     title="Recommendations Word Cloud (2011-2023)",
-    output_dir=output_dir
+    output_dir=output_dir,
+    cache=chart_cache
 )
 
 # ----------------  FINDINGS  ---------------------------
-create_word_cloud(
-    df=df_collection,
+create_word_cloud_from_counts(
+    source=term_matrix,
     start_year=2000,
     end_year=2010,
     column="findings",
     color="blue",
     title="Findings Word Cloud (2000-2010)",
-    output_dir=output_dir
+    output_dir=output_dir,
+    cache=chart_cache
 )
-create_word_cloud(
-    df=df_collection,
+create_word_cloud_from_counts(
+    source=term_matrix,
     start_year=2011,
     end_year=2023,
     column="findings",
     color="orange",
     title="Findings Word Cloud (2011-2023)",
-    output_dir=output_dir
+    output_dir=output_dir,
+    cache=chart_cache
 )
 
 # ---------------  ALL  ----------------------------
-create_word_cloud(
-    df=df_collection,
+create_word_cloud_from_counts(
+    source=term_matrix,
     start_year=2000,
     end_year=2010,
     column="all",
     color="blue",
     title="Word Cloud (2000-2010)",
-    output_dir=output_dir
+    output_dir=output_dir,
+    cache=chart_cache
 )
-create_word_cloud(
-    df=df_collection,
+create_word_cloud_from_counts(
+    source=term_matrix,
     start_year=2011,
     end_year=2023,
     column="all",
     color="orange",
     title="Word Cloud (2011-2023)",
-    output_dir=output_dir
+    output_dir=output_dir,
+    cache=chart_cache
 )
 
 # ----  COUNTRY/REGION BASED WORD CLOUD  -------------
-create_word_cloud(
-    df=df_collection,
+create_word_cloud_from_counts(
+    source=term_matrix,
     start_year=2011,
     end_year=2023,
     countries="Japan",  # Multiple countries can be given by Japan,Argentina,Australia etc.
@@ -95,5 +108,7 @@ create_word_cloud(
     column="all",
     color="orange",
     title="Word Cloud (2011-2023)",
-    output_dir=output_dir
-)
\ No newline at end of file
+    output_dir=output_dir,
+    cache=chart_cache
+)
+print(f"Chart cache: {chart_cache.stats()}")
@@ -0,0 +1,51 @@
+import importlib
+
+# helper functions live in submodules that are imported on first use, so `from helper import X` only pays
+# for the libraries behind X: a chart script never loads spaCy or SQLAlchemy, and NLTK only for the stop words
+# of a word cloud (or nltk_resources, which also brings requests and typer)
+_submodules = {
+    "charts": [
+        "recommendation_categories", "render_profiles", "get_render_profile", "profile_filename", "save_chart",
+        "save_word_cloud", "cloud_color", "rgba_to_hex", "word_cloud_frequencies", "render_cached",
+        "create_word_cloud", "create_word_cloud_from_counts", "keyword_frequencies", "word_cloud_counts",
+        "render_word_cloud", "show_ts_plot", "count_terms", "process_ts_frequency", "generate_ts",
+        "get_chart_filename", "get_ts_filename", "get_wc_filename", "calculate_terms_in_category",
+        "score_categories", "filter_df_for_ts", "filter_df_for_wc", "filter_df_for_cc", "generate_category_chart"
+    ],
+    "countries": ["extract_countries"],
+    "db": [
+        "get_collection", "getAllCountries", "getAllYearsByCountry", "getAllCriteriaByYearCountry",
+        "getNumberOfEntries", "getCountryYearCriteriaWiseFindingRecommendationRows", "buildCountry",
+        "iterCountryYearCriteriaWiseFindingRecommendation", "getCountryYearCriteriaWatermarkRows",
+        "getCountryYearCriteriaWatermarks"
+    ],
+    "incremental": [
+        "load_watermarks", "save_watermarks", "diff_watermarks", "order_keyword_frame", "merge_keyword_frames",
+        "load_checkpoint", "open_checkpoint", "write_checkpoint", "save_atomic"
+    ],
+    "nlp": [
+        "split_sentences", "get_keyword_filter", "filter_keywords", "extract_keywords", "load_nlp", "share_nlp_with_workers",
+        "extract_keywords_pipe",
+        "keyword_cache_fingerprint", "extract_keywords_cached", "extract_keywords_batch"
+    ],
+    "resources": [
+        "local_path", "join_location", "verify_checksum", "resumed_download", "nltk_resource_exists",
+        "nltk_package_checksums", "nltk_download_resource", "nltk_resources", "mirror_checksums",
+        "spacy_get_model_info", "spacy_download_model", "spacy_model_installed", "spacy_resource", "fetch_resources"
+    ],
+    "stop_words": ["additional_stop_words", "get_stop_words"]
+}
+_locations = {name: submodule for submodule, names in _submodules.items() for name in names}
+
+
+def __getattr__(name):
+    submodule = _locations.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_locations))
@@ -0,0 +1,404 @@
+import heapq
+import os
+import re
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+from matplotlib import pyplot as plt
+from wordcloud import WordCloud
+
+from helper.countries import extract_countries
+from helper.stop_words import get_stop_words
+from term_counter import count_terms_column, count_categories_column
+from terms import economic_reform_terms, environmental_policy_terms, social_policy_terms, gender_related_terms
+
+recommendation_categories = {
+    'economic reforms': economic_reform_terms,
+    'environmental policies': environmental_policy_terms,
+    'social policies': social_policy_terms,
+    'gender': gender_related_terms
+}
+
+# WordCloud's default token pattern
+_word_cloud_token = re.compile(r"\w[\w']*")
+
+# output settings per use of a chart; without a profile charts keep their original size and PNG output
+render_profiles = {
+    "preview": {"cloud_size": (960, 540), "dpi": 100, "format": "png", "pil_kwargs": {"compress_level": 1}},
+    "web": {"cloud_size": (1920, 1080), "dpi": 200, "format": "webp", "pil_kwargs": {"quality": 85}},
+    "print": {"cloud_size": (1920, 1080), "dpi": 600, "format": "png", "pil_kwargs": {"compress_level": 9}}
+}
+
+
+def get_render_profile(profile=None):
+    # a profile name from render_profiles or a dict with the same keys
+    if profile is None or isinstance(profile, dict):
+        return profile
+    if profile not in render_profiles:
+        raise ValueError(f"Unknown render profile {profile}, expected one of {', '.join(render_profiles)}")
+    return render_profiles[profile]
+
+
+def profile_filename(filename, profile=None):
+    if profile is None:
+        return filename
+    return f"{os.path.splitext(filename)[0]}.{profile['format']}"
+
+
+def save_chart(filename, profile=None, dpi="figure", **kwargs):
+    if profile is None:
+        plt.savefig(filename, dpi=dpi, **kwargs)
+        return
+    if profile["format"] != "svg":
+        kwargs["pil_kwargs"] = profile.get("pil_kwargs")
+    plt.savefig(filename, dpi=profile["dpi"], format=profile["format"], **kwargs)
+
+
+def save_word_cloud(wordcloud, filename, profile=None):
+    # the laid out cloud is written as it is, without a matplotlib figure around it
+    profile = profile or {"format": "png"}
+    if profile["format"] == "svg":
+        with open(filename, "w", encoding="utf-8") as file:
+            file.write(wordcloud.to_svg())
+        return
+    wordcloud.to_image().save(filename, format=profile["format"], **profile.get("pil_kwargs", {}))
+
+
+def cloud_color(**kwargs):
+    colors = {
+        "blue": "27, 102, 167",
+        "orange": "154, 46, 10"
+    }
+
+    frequency = kwargs.get('frequency', 1)
+    max_freq = kwargs.get('max_frequency', 1)
+    color = kwargs.get('color', "blue")
+    alpha = max(0.1, frequency / max_freq)
+    return rgba_to_hex(f"{colors[color]}, {alpha}")
+
+
+def rgba_to_hex(color):
+    color = color.strip().replace(' ', '').lower().split(",")
+    r, g, b, a = [int(item) for item in color[:-1]] + [float(color[-1])]
+    r = max(0, min(r, 255))
+    g = max(0, min(g, 255))
+    b = max(0, min(b, 255))
+    a = max(0.0, min(a, 1.0))
+    r = int(r * a + 255 * (1 - a))
+    g = int(g * a + 255 * (1 - a))
+    b = int(b * a + 255 * (1 - a))
+    return f'#{r:02X}{g:02X}{b:02X}'
+
+
+def word_cloud_frequencies(text):
+    # tokenised once, with the same stop words and collocations the layout would apply
+    return WordCloud(stopwords=get_stop_words()).process_text(text)
+
+
+def render_cached(cache, filename, function, source, params, render):
+    # render() writes filename unless the ChartCache has it from the same data and parameters
+    if cache is None:
+        render()
+        return
+    key = cache.key(function, source, params)
+    if cache.is_fresh(filename, key):
+        return
+    render()
+    cache.record(filename, key)
+
+
+def create_word_cloud(df, column, color, title, output_dir, start_year, end_year, countries=None, top_n=None,
+                      profile=None, cache=None):
+    profile = get_render_profile(profile)
+    filename = profile_filename(os.path.join(output_dir, get_wc_filename(column, start_year, end_year, countries)), profile)
+
+    def render():
+        text = filter_df_for_wc(df, column, start_year, end_year, countries)
+        render_word_cloud(word_cloud_frequencies(text), color, title, filename, top_n, profile)
+
+    params = [column, color, title, start_year, end_year, countries, top_n, profile, sorted(get_stop_words())]
+    render_cached(cache, filename, "create_word_cloud", df, params, render)
+
+
+def create_word_cloud_from_counts(source, column, color, title, output_dir, start_year, end_year, countries=None,
+                                  top_n=None, profile=None, cache=None):
+    # source is the keyword table or a TermMatrix; the counts are aggregated per term, so memory
+    # follows the vocabulary instead of one string of the whole corpus
+    profile = get_render_profile(profile)
+    filename = profile_filename(os.path.join(output_dir, get_wc_filename(column, start_year, end_year, countries)), profile)
+
+    def render():
+        frequency = word_cloud_counts(keyword_frequencies(source, column, start_year, end_year, countries))
+        render_word_cloud(frequency, color, title, filename, top_n, profile)
+
+    params = [column, color, title, start_year, end_year, countries, top_n, profile, sorted(get_stop_words())]
+    render_cached(cache, filename, "create_word_cloud_from_counts", source, params, render)
+
+
+def keyword_frequencies(source, column, start_year, end_year, countries=None):
+    # a TermMatrix sums its sparse rows; a keyword table is filtered down to the one column and its tokens
+    # are counted by pandas, in order of first occurrence like a Counter
+    if not isinstance(source, pd.DataFrame):
+        return source.frequencies(column, start_year, end_year, countries)
+    years = source["year"].astype(int)
+    mask = (years >= start_year) & (years <= end_year)
+    countries = extract_countries(countries)
+    if countries:
+        mask &= source["country"].isin(countries)
+    counts = source.loc[mask, column].str.split(" ").explode().value_counts(sort=False)
+    return counts.drop("", errors="ignore").to_dict()
+
+
+def word_cloud_counts(counts):
+    # the unigram steps of WordCloud.process_text (tokens, 's, numbers, stop words, plurals) applied
+    # to term counts; collocations need the running text and are not formed
+    stop_words = get_stop_words()
+    frequency = Counter()
+    for term, count in counts.items():
+        for word in _word_cloud_token.findall(term):
+            if word.lower().endswith("'s"):
+                word = word[:-2]
+            if not word.isdigit() and word.lower() not in stop_words:
+                frequency[word] += count
+    for word in list(frequency):
+        if word.endswith("s") and not word.endswith("ss") and word[:-1] in frequency:
+            frequency[word[:-1]] += frequency.pop(word)
+    return dict(frequency)
+
+
+def render_word_cloud(frequency, color, title, filename, top_n=None, profile=None):
+    # top_n keeps only the most frequent terms before layout
+    if top_n:
+        frequency = dict(heapq.nlargest(top_n, frequency.items(), key=lambda item: item[1]))
+    max_frequency = max(frequency.values(), default=1)
+    profile = get_render_profile(profile)
+    width, height = profile["cloud_size"] if profile else (1920, 1080)
+    filename = profile_filename(filename, profile)
+    wordcloud = WordCloud(
+        max_font_size=250 * width // 1920,
+        min_font_size=10,
+        width=width,
+        height=height,
+        background_color="white",
+        color_func=lambda word, font_size, position, orientation, random_state=None, **kwargs: cloud_color(
+            color=color,
+            frequency=frequency.get(word, 1),
+            max_frequency=max_frequency
+        ),
+    ).generate_from_frequencies(frequency)
+    if not title:
+        save_word_cloud(wordcloud, filename, profile)
+        print(f"Saved as: {filename}")
+        return
+    plt.figure(figsize=(9, 5))
+    plt.imshow(wordcloud, interpolation="bilinear")
+    plt.title(title)
+    plt.axis("off")
+    save_chart(filename, profile, dpi=600)
+    plt.close()
+    print(f"Saved as: {filename}")
+
+
+def show_ts_plot(x, y, color, title, xlabel, ylabel, figsize, filename, profile=None):
+    profile = get_render_profile(profile)
+    filename = profile_filename(filename, profile)
+    plt.figure(figsize=figsize)
+    plt.plot(y, x, color)
+    plt.title(title)
+    plt.xlabel(ylabel)
+    plt.ylabel(xlabel)
+    plt.grid(True)
+    save_chart(filename, profile)
+    plt.close()
+    print(f"Saved as: {filename}")
+
+
+def count_terms(text, related_terms):
+    count = 0
+    for term in related_terms:
+        count += text.lower().count(term)
+    return count
+
+
+def process_ts_frequency(df, related_terms, start_year, end_year, countries=None, dp=2, whole_tokens=False):
+    # dp for maximum decimal position
+    df_filtered = filter_df_for_ts(df, start_year, end_year, countries)
+    df_filtered["relevant_term_count"] = count_terms_column(df_filtered["all"], related_terms, whole_tokens)
+    df_filtered = df_filtered[["country", "year", "all_terms_count", "year_entries", "relevant_term_count"]]
+    df_filtered["trend_terms"] = (
+            (df_filtered["relevant_term_count"] / df_filtered["year_entries"]).round(dp) * pow(10, dp)
+    ).astype(int)
+    yearly_terms_count = df_filtered.groupby("year")["trend_terms"].sum().reset_index(name="term_count")
+    yearly_document_count = df_filtered.groupby("year")["country"].size().reset_index(name="document_count")
+    yearly_trends = pd.merge(yearly_terms_count, yearly_document_count, on="year")
+    yearly_trends["trends"] = (
+        (yearly_trends["term_count"] / yearly_trends["document_count"]).round(dp)
+    ).astype(int)
+    series_data = yearly_trends[["year", "trends"]]
+    series_data.loc[:, "year"] = series_data["year"].astype(int)
+    return series_data
+
+
+def generate_ts(df, related_terms, color, title, x_label, y_label, output_dir,
+                start_year, end_year, relevancy, countries=None, dp=2, figsize=(12, 6), whole_tokens=False, cube=None,
+                profile=None, cache=None):
+    # a TermCube built with the same term list answers without scanning df, which may then be None
+    use_cube = cube is not None and not whole_tokens and cube.has(relevancy, related_terms)
+    profile = get_render_profile(profile)
+    filename = get_ts_filename(relevancy, start_year, end_year, countries)
+    filename = profile_filename(os.path.join(output_dir, filename), profile)
+
+    def render():
+        if use_cube:
+            series_data = cube.ts_frequency(relevancy, start_year, end_year, countries, dp)
+        else:
+            series_data = process_ts_frequency(df, related_terms, start_year, end_year, countries, dp, whole_tokens)
+        show_ts_plot(series_data["trends"], series_data["year"], color, title, x_label, y_label, figsize, filename,
+                     profile)
+
+    params = [related_terms, color, title, x_label, y_label, start_year, end_year, relevancy, countries, dp,
+              figsize, whole_tokens, profile]
+    render_cached(cache, filename, "generate_ts", cube if use_cube else df, params, render)
+
+
+def get_chart_filename(start_year, end_year, countries=None):
+    def clean_name(name):
+        return re.sub(r'[^\w]', '_', name).lower()
+
+    if not countries:
+        return f"rc_{start_year}_{end_year}.png"
+
+    if isinstance(countries, list):
+        countries = [clean_name(countries[0])] + [clean_name(countries[-1])] if len(countries) > 1 else [
+            clean_name(countries[0])]
+    else:
+        countries = [clean_name(countries.strip().split(',')[0]),
+                     clean_name(countries.strip().split(',')[-1])] if ',' in countries else [clean_name(countries)]
+
+    return f"rc_{start_year}_{end_year}_{'_'.join(countries)}.png"
+
+
+def get_ts_filename(relevancy, start_year, end_year, countries=None):
+    def clean_name(name):
+        return re.sub(r'[^\w]', '_', name).lower()
+
+    if not countries:
+        return f"ts_{relevancy}_terms_{start_year}_{end_year}.png"
+
+    if isinstance(countries, list):
+        countries = [clean_name(countries[0])] + [clean_name(countries[-1])] if len(countries) > 1 else [
+            clean_name(countries[0])]
+    else:
+        countries = [clean_name(countries.strip().split(',')[0]),
+                     clean_name(countries.strip().split(',')[-1])] if ',' in countries else [clean_name(countries)]
+
+    return f"ts_{relevancy}_terms_{start_year}_{end_year}_{'_'.join(countries)}.png"
+
+
+def get_wc_filename(column, start_year, end_year, countries=None):
+    def clean_name(name):
+        return re.sub(r'[^\w]', '_', name).lower()
+
+    if not countries:
+        return f"{column}_wordcloud_{start_year}_{end_year}.png"
+
+    if isinstance(countries, list):
+        countries = [clean_name(countries[0])] + [clean_name(countries[-1])] if len(countries) > 1 else [
+            clean_name(countries[0])]
+    else:
+        countries = [clean_name(countries.strip().split(',')[0]),
+                     clean_name(countries.strip().split(',')[-1])] if ',' in countries else [clean_name(countries)]
+
+    return f"{column}_wordcloud_{start_year}_{end_year}_{'_'.join(countries)}.png"
+
+
+def calculate_terms_in_category(df_filtered, related_terms, dp=2, whole_tokens=False):
+    df_filtered["relevant_term_count"] = count_terms_column(df_filtered["recommendations"], related_terms, whole_tokens)
+    df_filtered = df_filtered[
+        ["country", "year", "recommendations_count", "year_entries", "relevant_term_count"]
+    ].copy()
+    df_filtered.loc[df_filtered.index, "trend_terms"] = (
+            (df_filtered["relevant_term_count"] / df_filtered["year_entries"]).round(dp) * pow(10, dp)
+    ).astype(int)
+    yearly_terms_count = df_filtered.groupby("year")["trend_terms"].sum().reset_index(name="term_count")
+    yearly_document_count = df_filtered.groupby("year")["country"].size().reset_index(name="document_count")
+    yearly_trends = pd.merge(yearly_terms_count, yearly_document_count, on="year")
+    yearly_trends["trends"] = (
+        (yearly_trends["term_count"] / yearly_trends["document_count"]).round(dp)
+    ).astype(int)
+
+    return yearly_trends["term_count"].sum()
+
+
+def score_categories(df_filtered, categories, column="recommendations", dp=2, whole_tokens=False):
+    # every category counted in a single scan of the column, as tidy (year, country, category) rows;
+    # trend_terms is the per-row score calculate_terms_in_category sums up
+    counts = count_categories_column(df_filtered[column], categories, whole_tokens)
+    entries = df_filtered["year_entries"].to_numpy(dtype=float)[:, None]
+    trend_terms = (np.round(counts / entries, dp) * pow(10, dp)).astype(int)
+    return pd.DataFrame({
+        "year": np.repeat(df_filtered["year"].to_numpy(), len(categories)),
+        "country": np.repeat(df_filtered["country"].to_numpy(), len(categories)),
+        "category": np.tile(list(categories), len(df_filtered)),
+        "relevant_term_count": counts.ravel(),
+        "trend_terms": trend_terms.ravel()
+    })
+
+
+def filter_df_for_ts(df, start_year, end_year, countries=None):
+    filtered_df = df[(df['year'].astype(int) >= start_year) & (df['year'].astype(int) <= end_year)]
+    countries = extract_countries(countries)
+
+    if countries:
+        filtered_df = filtered_df[filtered_df["country"].isin(countries)]
+
+    return filtered_df.copy()
+
+
+def filter_df_for_wc(df, column, start_year, end_year, countries=None):
+    filtered_df = df[(df['year'].astype(int) >= start_year) & (df['year'].astype(int) <= end_year)]
+    countries = extract_countries(countries)
+
+    if countries:
+        filtered_df = filtered_df[filtered_df["country"].isin(countries)]
+
+    return " ".join(filtered_df[column])
+
+
+def filter_df_for_cc(df, start_year, end_year, countries=None):
+    filtered_df = df[(df['year'].astype(int) >= start_year) & (df['year'].astype(int) <= end_year)]
+    countries = extract_countries(countries)
+
+    if countries:
+        filtered_df = filtered_df[filtered_df["country"].isin(countries)]
+
+    return filtered_df
+
+
+def generate_category_chart(df, start_year, end_year, output_dir, countries=None, profile=None, cache=None):
+    profile = get_render_profile(profile)
+    output_file = profile_filename(os.path.join(output_dir, get_chart_filename(start_year, end_year, countries)), profile)
+
+    def render():
+        filtered_df = filter_df_for_cc(df, start_year, end_year, countries)
+        scores = score_categories(filtered_df, recommendation_categories)
+        term_count = scores.groupby("category", sort=False)["trend_terms"].sum()
+
+        _category = {
+            'category': list(recommendation_categories),
+            'term_count': [int(term_count.get(category, 0)) for category in recommendation_categories]
+        }
+
+        plt.figure(figsize=(10, 9))
+        plt.barh(_category['category'], _category['term_count'], color='#81BE37')
+        plt.xlabel('Frequency')
+        plt.title(f'Recommendations Categorization for {start_year}-{end_year}')
+        plt.gca().invert_yaxis()
+        save_chart(output_file, profile, bbox_inches="tight")
+        plt.tight_layout()
+        plt.close()
+        print(f"Saved as: {output_file}")
+
+    params = [start_year, end_year, countries, recommendation_categories, profile]
+    render_cached(cache, output_file, "generate_category_chart", df, params, render)
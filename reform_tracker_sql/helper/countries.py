@@ -0,0 +1,28 @@
+def extract_countries(countries=None):
+    regions = {
+        'Europe': [
+            'Estonia', 'Latvia', 'Lithuania', 'Belgium', 'Croatia', 'Czech Republic',
+            'Euro Area', 'France', 'Germany', 'Hungary', 'Ireland', 'Luxembourg',
+            'Netherlands', 'Norway', 'Poland', 'Portugal', 'Russian Federation',
+            'Slovenia', 'Spain', 'Sweden', 'Switzerland', 'Ukraine', 'United Kingdom'
+        ],
+        'Asia': [
+            'China', 'Indonesia', 'Japan', 'Korea', 'Malaysia', 'Türkiye',
+            'Viet Nam'
+        ],
+        'America': [
+            'Argentina', 'Brazil', 'Colombia', 'Costa Rica', 'Mexico', 'United States'
+        ]
+    }
+
+    if not countries:
+        return countries
+
+    if isinstance(countries, str):
+        countries = [country.strip() for country in countries.split(',')]
+
+    return [
+        country for item in countries for country in (
+            regions.get(item, [item]) if item in regions else [item]
+        )
+    ]
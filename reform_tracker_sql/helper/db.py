@@ -0,0 +1,287 @@
+import hashlib
+import sys
+from itertools import groupby
+
+from sqlalchemy import cast, func, tuple_
+from sqlalchemy.dialects.mysql import BIGINT
+from sqlalchemy.exc import SQLAlchemyError
+from tqdm import tqdm
+
+from entities.Collection import Collection
+from entities.Country import Country
+from entities.Criteria import Criteria
+from entities.FindingRecommendation import FindingRecommendation
+from entities.FindingRecommendationTable import FindingRecommendationTable
+from entities.Year import Year
+from models.Connection import getSession, sessionScope
+from models.CountryModel import CountryModel
+from models.YearModel import YearModel
+from models.CountryYearCriteriaModel import CountryYearCriteriaModel
+from models.FindingRecommendationModel import FindingRecommendationModel
+from models.CriteriaModel import CriteriaModel
+
+
+def get_collection(stream=False, yield_per=1000, country_years=None):
+    # country_years limits the load to these (country_id, year_id) pairs
+    if stream:
+        return iterCountryYearCriteriaWiseFindingRecommendation(country_years)
+
+    # FR texts live in one columnar table, criteria only hold a row range into it
+    total_entries = getNumberOfEntries()
+    table = FindingRecommendationTable()
+    collection = []
+    session = getSession()
+    try:
+        rows = getCountryYearCriteriaWiseFindingRecommendationRows(session, country_years).yield_per(yield_per)
+        with tqdm(total=total_entries, desc="Plucking From Database") as pbar:
+            for (country_id, country_name), country_rows in groupby(
+                    rows, key=lambda row: (row.country_id, row.country_name)):
+                _years = []
+                for (year_id, year_name), year_rows in groupby(
+                        country_rows, key=lambda row: (row.year_id, row.year_name)):
+                    if year_id is None:
+                        continue
+                    _criteria_list = []
+                    for (criteria_id, criteria_title), criteria_rows in groupby(
+                            year_rows, key=lambda row: (row.criteria_id, row.criteria_title)):
+                        if criteria_id is None:
+                            continue
+                        start = len(table)
+                        for row in criteria_rows:
+                            if row.fr_id is not None:
+                                table.append(row.fr_id, row.finding, row.recommendation)
+                                pbar.update(1)
+                        if criteria_title:
+                            criteria_title = sys.intern(criteria_title)
+                        _criteria_list.append(Criteria(criteria_id, criteria_title, table.view(start, len(table))))
+                    _years.append(Year(year_id, year_name, _criteria_list))
+                collection.append(Country(country_id, country_name, _years))
+    except SQLAlchemyError as e:
+        print(f"SQLAlchemyError occurred: {e}")
+    except Exception as e:
+        print(f"Error occurred: {e}")
+    finally:
+        session.close()
+
+    table.freeze()
+    return Collection(collection)
+
+
+def getAllCountries():
+    countries = []
+    try:
+        with sessionScope() as session:
+            countries = session.query(CountryModel).order_by(CountryModel.name.asc()).all()
+    except SQLAlchemyError as e:
+        print(f"SQLAlchemyError occurred: {e}")
+    except Exception as e:
+        print(f"Error occurred: {e}")
+    finally:
+        return countries
+
+
+def getAllYearsByCountry(country):
+    session = getSession()
+    years = []
+    try:
+        session.add(country)
+        for cyc in country.years.goup_by(CountryYearCriteriaModel.year_id):
+            years.append(cyc.year)
+    except SQLAlchemyError as e:
+        print(f"SQLAlchemyError occurred: {e}")
+    except Exception as e:
+        print(f"Error occurred: {e}")
+    finally:
+        session.close()
+        return years
+
+
+def getAllCriteriaByYearCountry(country, year):
+    session = getSession()
+    criteria = []
+    try:
+        session.add(country)
+        for cyc in country.years.filter(CountryYearCriteriaModel.year_id == year.id).all():
+            criteria.append(cyc.criteria)
+    except SQLAlchemyError as e:
+        print(f"SQLAlchemyError occurred: {e}")
+    except Exception as e:
+        print(f"Error occurred: {e}")
+    finally:
+        session.close()
+        return criteria
+
+
+def getNumberOfEntries():
+    count = 0
+    try:
+        with sessionScope() as session:
+            count = session.query(func.count()).select_from(FindingRecommendationModel).scalar()
+    except SQLAlchemyError as e:
+        print(f"SQLAlchemyError occurred: {e}")
+    except Exception as e:
+        print(f"Error occurred: {e}")
+    finally:
+        return count
+
+
+def getCountryYearCriteriaWiseFindingRecommendationRows(session, country_years=None):
+    query = session.query(
+        CountryModel.id.label("country_id"),
+        CountryModel.name.label("country_name"),
+        YearModel.id.label("year_id"),
+        YearModel.name.label("year_name"),
+        CriteriaModel.id.label("criteria_id"),
+        CriteriaModel.title.label("criteria_title"),
+        FindingRecommendationModel.id.label("fr_id"),
+        FindingRecommendationModel.finding.label("finding"),
+        FindingRecommendationModel.recommendation.label("recommendation")
+    ).select_from(CountryModel).outerjoin(
+        CountryYearCriteriaModel, CountryYearCriteriaModel.country_id == CountryModel.id
+    ).outerjoin(
+        YearModel, CountryYearCriteriaModel.year_id == YearModel.id
+    ).outerjoin(
+        CriteriaModel, CountryYearCriteriaModel.criteria_id == CriteriaModel.id
+    ).outerjoin(
+        FindingRecommendationModel, FindingRecommendationModel.cyc_id == CountryYearCriteriaModel.id
+    ).order_by(
+        CountryModel.name.asc(),
+        CountryModel.id.asc(),
+        YearModel.name.asc(),
+        CountryYearCriteriaModel.criteria_id.asc(),
+        FindingRecommendationModel.id.asc()
+    )
+    if country_years is not None:
+        query = query.filter(
+            tuple_(CountryYearCriteriaModel.country_id, CountryYearCriteriaModel.year_id).in_(list(country_years))
+        )
+    return query
+
+
+def buildCountry(country_id, country_name, rows):
+    # rows of one country in query order -> Country with its FRs as FindingRecommendation objects
+    _years = []
+    for (year_id, year_name), year_rows in groupby(rows, key=lambda row: (row.year_id, row.year_name)):
+        if year_id is None:
+            continue
+        _criteria_list = []
+        for (criteria_id, criteria_title), criteria_rows in groupby(
+                year_rows, key=lambda row: (row.criteria_id, row.criteria_title)):
+            if criteria_id is None:
+                continue
+            frs = [
+                FindingRecommendation(row.fr_id, row.finding, row.recommendation)
+                for row in criteria_rows if row.fr_id is not None
+            ]
+            _criteria_list.append(Criteria(criteria_id, criteria_title, frs))
+        _years.append(Year(year_id, year_name, _criteria_list))
+    return Country(country_id, country_name, _years)
+
+
+def iterCountryYearCriteriaWiseFindingRecommendation(country_years=None):
+    # yields (country, year, criteria, frs) batches; every country is read with its own query and the session
+    # is closed before its batches are yielded, so no cursor stays open while the caller runs NLP on them
+    session = getSession()
+    try:
+        query = session.query(CountryModel.id, CountryModel.name).order_by(
+            CountryModel.name.asc(), CountryModel.id.asc()
+        )
+        if country_years is not None:
+            query = query.filter(CountryModel.id.in_({country_id for country_id, _ in country_years}))
+        countries = query.all()
+    except SQLAlchemyError as e:
+        print(f"SQLAlchemyError occurred: {e}")
+        raise
+    finally:
+        session.close()
+
+    for country_id, country_name in countries:
+        selected = None
+        if country_years is not None:
+            selected = [country_year for country_year in country_years if country_year[0] == country_id]
+        session = getSession()
+        try:
+            rows = getCountryYearCriteriaWiseFindingRecommendationRows(session, selected).filter(
+                CountryModel.id == country_id
+            ).all()
+        except SQLAlchemyError as e:
+            print(f"SQLAlchemyError occurred: {e}")
+            raise
+        finally:
+            session.close()
+
+        country = buildCountry(country_id, country_name, rows)
+        for year in country.years:
+            for _criteria in year.criteria:
+                yield country, year, _criteria, _criteria.frs
+
+
+def getCountryYearCriteriaWatermarkRows(session):
+    # one row per country_years_criteria with its FR count, max FR id and an order independent XOR of the
+    # first 64 bits of MD5 over every FR id and text, so MySQL hashes the texts and none of them is sent over
+    fr_digest = cast(func.conv(func.left(func.md5(func.concat_ws(
+        "\0", FindingRecommendationModel.id, FindingRecommendationModel.finding,
+        FindingRecommendationModel.recommendation
+    )), 16), 16, 10), BIGINT(unsigned=True))
+    group = (
+        CountryYearCriteriaModel.id, CountryModel.id, YearModel.id, CountryModel.name, YearModel.name,
+        CountryYearCriteriaModel.criteria_id, CriteriaModel.title
+    )
+    return session.query(
+        *group,
+        func.coalesce(func.max(FindingRecommendationModel.id), 0),
+        func.count(FindingRecommendationModel.id),
+        func.coalesce(func.bit_xor(fr_digest), 0)
+    ).select_from(CountryModel).join(
+        CountryYearCriteriaModel, CountryYearCriteriaModel.country_id == CountryModel.id
+    ).outerjoin(
+        YearModel, CountryYearCriteriaModel.year_id == YearModel.id
+    ).outerjoin(
+        CriteriaModel, CountryYearCriteriaModel.criteria_id == CriteriaModel.id
+    ).outerjoin(
+        FindingRecommendationModel, FindingRecommendationModel.cyc_id == CountryYearCriteriaModel.id
+    ).group_by(*group).order_by(
+        CountryModel.name.asc(),
+        CountryModel.id.asc(),
+        YearModel.name.asc(),
+        CountryYearCriteriaModel.criteria_id.asc()
+    )
+
+
+def getCountryYearCriteriaWatermarks(yield_per=1000):
+    # cyc_id -> [country_id, year_id, country, year, max FR id, FR count, content hash];
+    # a failed read raises, partial watermarks would mark the missing country-years as deleted
+    session = getSession()
+    watermarks = dict()
+    try:
+        if session.get_bind().dialect.name == "mysql":
+            rows = getCountryYearCriteriaWatermarkRows(session)
+            for cyc_id, country_id, year_id, country, year, criteria_id, title, max_id, count, digest in rows:
+                content = hashlib.sha1(f"{criteria_id}\0{title}\0{digest}".encode("utf-8")).hexdigest()
+                watermarks[str(cyc_id)] = [country_id, year_id, country, year, max_id, count, content]
+            return watermarks
+
+        # other databases have no MD5(): the FR texts are streamed and hashed here instead
+        rows = getCountryYearCriteriaWiseFindingRecommendationRows(session).add_columns(
+            CountryYearCriteriaModel.id.label("cyc_id")
+        ).execution_options(stream_results=True).yield_per(yield_per)
+        digests = dict()
+        for row in rows:
+            if row.cyc_id is None:
+                continue
+            cyc_id = str(row.cyc_id)
+            if cyc_id not in watermarks:
+                watermarks[cyc_id] = [row.country_id, row.year_id, row.country_name, row.year_name, 0, 0]
+                digests[cyc_id] = hashlib.sha1(f"{row.criteria_id}\0{row.criteria_title}\0".encode("utf-8"))
+            if row.fr_id is not None:
+                watermarks[cyc_id][4] = max(watermarks[cyc_id][4], row.fr_id)
+                watermarks[cyc_id][5] += 1
+                digests[cyc_id].update(f"{row.fr_id}\0{row.finding}\0{row.recommendation}\0".encode("utf-8"))
+        for cyc_id, digest in digests.items():
+            watermarks[cyc_id].append(digest.hexdigest())
+        return watermarks
+    except SQLAlchemyError as e:
+        print(f"SQLAlchemyError occurred: {e}")
+        raise
+    finally:
+        session.close()
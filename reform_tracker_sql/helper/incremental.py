@@ -0,0 +1,103 @@
+import json
+import os
+
+import pandas as pd
+
+
+def load_watermarks(filename):
+    if not os.path.exists(filename):
+        return None
+    with open(filename, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save_watermarks(filename, fingerprint, watermarks):
+    def write(path):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"fingerprint": fingerprint, "rows": watermarks}, file)
+
+    save_atomic(filename, write)
+
+
+def diff_watermarks(previous, current):
+    # (country_id, year_id) groups to re-extract, and (country, year) names whose keyword rows are stale
+    def country_years(watermarks):
+        groups = dict()
+        for cyc_id, (country_id, year_id, country, year, *marks) in watermarks.items():
+            group = groups.setdefault((country_id, year_id), {"name": (country, year), "rows": set()})
+            group["rows"].add((cyc_id, *marks))
+        return groups
+
+    previous_groups = country_years(previous)
+    current_groups = country_years(current)
+    changed = {
+        key for key, group in current_groups.items()
+        if key not in previous_groups or previous_groups[key] != group
+    }
+    stale = {current_groups[key]["name"] for key in changed}
+    stale.update(
+        group["name"] for key, group in previous_groups.items() if key in changed or key not in current_groups
+    )
+    return changed, stale
+
+
+def order_keyword_frame(df, order):
+    # order: (country, year) names in database order
+    position = {name: index for index, name in enumerate(order)}
+    df = df.copy()
+    df["_order"] = [position.get(name, len(position)) for name in zip(df["country"], df["year"])]
+    return df.sort_values("_order", kind="stable").drop(columns="_order").reset_index(drop=True)
+
+
+def merge_keyword_frames(previous_df, updated_df, stale, order):
+    keep = ~pd.Series(list(zip(previous_df["country"], previous_df["year"])), index=previous_df.index).isin(stale)
+    df = pd.concat([previous_df[keep]] + ([updated_df] if len(updated_df) else []), ignore_index=True)
+    return order_keyword_frame(df, order)
+
+
+def load_checkpoint(filename, fingerprint):
+    # (country_id, year_id) -> keyword row finished by an interrupted run
+    rows = dict()
+    if not os.path.exists(filename):
+        return rows
+    with open(filename, "r", encoding="utf-8") as file:
+        try:
+            if json.loads(file.readline()).get("fingerprint") != fingerprint:
+                return rows
+            for line in file:
+                record = json.loads(line)
+                rows[(record["country_id"], record["year_id"])] = record["row"]
+        except json.JSONDecodeError:
+            # the last line may be torn if the run was killed mid-write
+            pass
+    return rows
+
+
+def open_checkpoint(filename, fingerprint, rows=None):
+    # the already finished rows are written to a temporary file that replaces the checkpoint in one step,
+    # so a crash while rewriting keeps the old checkpoint; later rows are appended as they complete
+    temporary = f"{filename}.tmp"
+    with open(temporary, "w", encoding="utf-8") as file:
+        file.write(json.dumps({"fingerprint": fingerprint}) + "\n")
+        for (country_id, year_id), row in (rows or {}).items():
+            file.write(json.dumps({"country_id": country_id, "year_id": year_id, "row": row}) + "\n")
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, filename)
+    return open(filename, "a", encoding="utf-8")
+
+
+def write_checkpoint(file, country_id, year_id, row):
+    file.write(json.dumps({"country_id": country_id, "year_id": year_id, "row": row}) + "\n")
+    file.flush()
+    os.fsync(file.fileno())
+
+
+def save_atomic(filename, write):
+    # write(path) produces the file under a temporary name that then replaces filename in one step;
+    # it is synced to disk first so a power loss cannot leave an empty file behind the new name
+    temporary = f"{filename}.tmp"
+    write(temporary)
+    with open(temporary, "rb+") as file:
+        os.fsync(file.fileno())
+    os.replace(temporary, filename)
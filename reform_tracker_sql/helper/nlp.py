@@ -0,0 +1,162 @@
+import gc
+import multiprocessing
+import re
+from collections import deque
+
+import spacy
+import spacy.language
+
+from helper.stop_words import get_stop_words
+from keyword_cache import KeywordCache
+from keyword_filter import KEYWORD_FILTER_VERSION, KeywordFilter
+
+# pipeline components the keyword filter reads from (pos_, lemma_, is_stop)
+_keyword_components = {"tok2vec", "tagger", "attribute_ruler", "lemmatizer"}
+# (model, excluded components, disabled components) -> loaded Language
+_languages = dict()
+# id(vocab) -> KeywordFilter compiled for it; spaCy's Vocab cannot be weakly referenced, so the filter holds
+# its vocab and with it the id, which can then not be reused for another vocab while the entry exists
+_keyword_filters = dict()
+
+
+def split_sentences(text):
+    sentences = re.split(r'(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<!\s\.\s)[.!?]\s+', text)
+    return [sentence.strip() for sentence in sentences if sentence.strip()]
+
+
+def get_keyword_filter(vocab):
+    # one compiled filter per vocab for the current stop words; a new stop-word set keeps the vocab's flag
+    stop_words = get_stop_words()
+    keyword_filter = _keyword_filters.get(id(vocab))
+    if keyword_filter is None:
+        keyword_filter = KeywordFilter(vocab, stop_words)
+        _keyword_filters[id(vocab)] = keyword_filter
+    elif keyword_filter.stop_words is not stop_words:
+        keyword_filter = KeywordFilter(vocab, stop_words, flag=keyword_filter.flag)
+        _keyword_filters[id(vocab)] = keyword_filter
+    return keyword_filter
+
+
+def filter_keywords(doc):
+    return get_keyword_filter(doc.vocab)(doc)
+
+
+def extract_keywords(_nlp, text):
+    all_keywords = []
+    for sentence in split_sentences(text):
+        all_keywords.append(filter_keywords(_nlp(sentence)))
+
+    return [item for sublist in all_keywords for item in sublist]
+
+
+def load_nlp(model, minimal=False, disable=()):
+    # every model configuration is deserialized once per process, later calls get the same Language
+    exclude = []
+    if minimal:
+        # keep only what pos_, lemma_ and is_stop depend on; parser, ner, senter etc. are never loaded
+        pipeline = spacy.info(model, silent=True).get("pipeline", [])
+        exclude = [name for name in pipeline if name not in _keyword_components]
+    key = (model, tuple(sorted(exclude)), tuple(sorted(disable)))
+    if key not in _languages:
+        _languages[key] = spacy.load(model, exclude=exclude, disable=list(disable))
+    return _languages[key]
+
+
+def share_nlp_with_workers(docs):
+    # docs is an nlp.pipe(n_process=...) stream, which starts its workers on the first next() with the
+    # multiprocessing module spaCy imported. Only for that call spaCy gets a local fork context, so the workers
+    # inherit the already loaded model copy-on-write instead of unpickling a copy each, and gc.freeze() keeps
+    # the children's garbage collector from touching (and so copying) the model's pages. The start method of
+    # the process and its garbage collector are left as they were once the workers run
+    docs = iter(docs)
+    if "fork" not in multiprocessing.get_all_start_methods() or not hasattr(spacy.language, "mp"):
+        yield from docs
+        return
+    default = spacy.language.mp
+    spacy.language.mp = multiprocessing.get_context("fork")
+    gc.freeze()
+    try:
+        first = next(docs, None)
+    finally:
+        spacy.language.mp = default
+        gc.unfreeze()
+    if first is not None:
+        yield first
+        yield from docs
+
+
+def extract_keywords_pipe(_nlp, items, batch_size=256, n_process=1, regex_split=True):
+    # items are (text, context) pairs; yields (keywords, context) in the same order,
+    # with every sentence of every text going through one nlp.pipe stream.
+    # regex_split=False hands every whole text to spaCy as one unit; the minimal pipeline has no parser or
+    # senter, so it is not split into sentences at all
+    def sentences():
+        for text, context in items:
+            text_sentences = (split_sentences(text) if regex_split else [text.strip()]) or [""]
+            for index, sentence in enumerate(text_sentences):
+                yield sentence, (context, index == len(text_sentences) - 1)
+
+    docs = _nlp.pipe(sentences(), as_tuples=True, batch_size=batch_size, n_process=n_process)
+    if n_process > 1:
+        docs = share_nlp_with_workers(docs)
+    keywords = []
+    for doc, (context, last) in docs:
+        keywords += filter_keywords(doc)
+        if last:
+            yield keywords, context
+            keywords = []
+
+
+def keyword_cache_fingerprint(_nlp, regex_split=True):
+    return KeywordCache.make_fingerprint(
+        spacy.__version__,
+        _nlp.meta.get("lang"),
+        _nlp.meta.get("name"),
+        _nlp.meta.get("version"),
+        ",".join(_nlp.pipe_names),
+        KEYWORD_FILTER_VERSION,
+        regex_split,
+        ",".join(sorted(get_stop_words()))
+    )
+
+
+def extract_keywords_cached(_nlp, items, cache, batch_size=256, n_process=1, regex_split=True, chunk_size=10000):
+    # same contract as extract_keywords_pipe, only cache misses go through spaCy. A result is yielded as soon as
+    # no miss is waiting ahead of it; at most chunk_size items wait behind a miss (hits as their keywords only,
+    # misses as their text) and the distinct missing texts among them go through one nlp.pipe stream
+    pending = deque()
+    # missing text -> its keywords, None until extracted; a text repeated in the window is extracted once
+    missing = dict()
+
+    def extracted():
+        # a handful of misses is not worth starting worker processes for
+        processes = n_process if len(missing) > batch_size else 1
+        for keywords, text in extract_keywords_pipe(
+                _nlp, ((text, text) for text in missing),
+                batch_size=batch_size, n_process=processes, regex_split=regex_split):
+            cache.put(text, keywords)
+            missing[text] = keywords
+            while pending and (pending[0][0] is None or missing[pending[0][0]] is not None):
+                text, context, keywords = pending.popleft()
+                yield (keywords if text is None else missing[text]), context
+        missing.clear()
+
+    for text, context in items:
+        keywords = None if text in missing else cache.get(text)
+        if keywords is not None and not pending:
+            yield keywords, context
+            continue
+        if keywords is None:
+            missing[text] = None
+        pending.append((None if keywords is not None else text, context, keywords))
+        if len(pending) >= chunk_size:
+            yield from extracted()
+    yield from extracted()
+
+
+def extract_keywords_batch(_nlp, texts, batch_size=256, n_process=1, regex_split=True):
+    return [
+        keywords for keywords, _ in extract_keywords_pipe(
+            _nlp, ((text, None) for text in texts), batch_size=batch_size, n_process=n_process, regex_split=regex_split
+        )
+    ]
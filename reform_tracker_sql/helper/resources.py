@@ -0,0 +1,284 @@
+import hashlib
+import importlib
+import importlib.metadata
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from urllib.parse import urlsplit
+from urllib.request import url2pathname
+from xml.etree import ElementTree
+
+import nltk
+import requests
+from nltk.data import find
+from packaging.version import InvalidVersion, Version
+from tqdm import tqdm
+from typer.colors import BLUE
+
+_chunk_size = 1024 * 1024
+_nltk_data_url = "https://raw.githubusercontent.com/nltk/nltk_data/gh-pages/"
+# a directory, file:// or http(s) URL holding nltk_data/ (the gh-pages layout of nltk/nltk_data) and
+# spacy_models/ (model wheels or sdists, optionally with a SHA256SUMS file) for offline setups
+_mirror = os.environ.get("RESOURCE_MIRROR")
+# pip must not install two models into the same environment at once
+_pip_lock = threading.Lock()
+
+
+def local_path(location):
+    # the file system path of a directory or file:// location, None for http(s) URLs
+    parts = urlsplit(location)
+    if parts.scheme == "file":
+        return url2pathname(parts.path)
+    if parts.scheme in ("http", "https"):
+        return None
+    return location
+
+
+def join_location(base, *parts):
+    path = local_path(base)
+    if path is not None:
+        return os.path.join(path, *parts)
+    return "/".join([base.rstrip("/")] + list(parts))
+
+
+def verify_checksum(file_name, checksum, algorithm="sha256"):
+    # nothing to compare against when the source publishes no checksum
+    if not checksum:
+        return
+    digest = hashlib.new(algorithm)
+    with open(file_name, "rb") as file:
+        for chunk in iter(lambda: file.read(_chunk_size), b""):
+            digest.update(chunk)
+    if digest.hexdigest() != checksum.lower():
+        raise ValueError(f"{algorithm} checksum mismatch for {file_name}")
+
+
+def resumed_download(source, file_name, checksum=None, algorithm="sha256", position=0):
+    # a partial file_name is continued with a Range request; servers that answer the whole file restart it
+    path = local_path(source)
+    if path is not None:
+        shutil.copyfile(path, file_name)
+    else:
+        _http_download(source, file_name, position)
+    try:
+        verify_checksum(file_name, checksum, algorithm)
+    except ValueError:
+        os.remove(file_name)
+        raise
+
+
+def _http_download(source, file_name, position=0):
+    offset = os.path.getsize(file_name) if os.path.exists(file_name) else 0
+    resume_header = {'Range': f'bytes={offset}-'} if offset else {}
+    with requests.get(source, headers=resume_header, stream=True, timeout=60) as response:
+        # 416: the partial file already holds every byte
+        if response.status_code != 416:
+            response.raise_for_status()
+            if response.status_code != 206:
+                offset = 0
+            content_length = response.headers.get('content-length')
+            total_size = offset + int(content_length) if content_length else None
+            with open(file_name, 'ab' if offset else 'wb') as file, tqdm(
+                    desc=os.path.basename(file_name),
+                    total=total_size,
+                    initial=offset,
+                    unit='B',
+                    unit_scale=True,
+                    unit_divisor=1024,
+                    colour=BLUE,
+                    position=position
+            ) as bar:
+                for chunk in response.iter_content(chunk_size=_chunk_size):
+                    if chunk:
+                        file.write(chunk)
+                        bar.update(len(chunk))
+
+
+def nltk_resource_exists(resource):
+    try:
+        find(resource)
+        return True
+    except LookupError:
+        return False
+
+
+@lru_cache(maxsize=None)
+def nltk_package_checksums(base):
+    # package id -> md5 of its zip as listed in index.xml, empty if the index cannot be read
+    try:
+        path = local_path(base)
+        if path is not None:
+            with open(os.path.join(path, "index.xml"), "rb") as file:
+                index = file.read()
+        else:
+            response = requests.get(join_location(base, "index.xml"), timeout=60)
+            response.raise_for_status()
+            index = response.content
+        return {
+            package.get("id"): package.get("checksum")
+            for package in ElementTree.fromstring(index).iter("package")
+        }
+    except (OSError, requests.RequestException, ElementTree.ParseError):
+        return {}
+
+
+def download_with_retry(source, file_name, checksum=None, algorithm="sha256", retry=3, position=0):
+    # the bytes arrive in file_name.part, which is kept when every attempt fails so the next run resumes it,
+    # and only becomes file_name once its checksum matched
+    partial_name = f"{file_name}.part"
+    for attempt in range(retry):
+        try:
+            resumed_download(source, partial_name, checksum, algorithm, position)
+            break
+        except (requests.RequestException, OSError, ValueError):
+            if attempt == retry - 1:
+                raise
+    os.replace(partial_name, file_name)
+
+
+def nltk_download_resource(resource, retry=3, mirror=None, position=0):
+    mirror = mirror or _mirror
+    base_url = join_location(mirror, "nltk_data") if mirror else _nltk_data_url
+    resource_url = join_location(base_url, "packages", *f"{resource}.zip".split("/"))
+    checksum = nltk_package_checksums(base_url).get(os.path.basename(resource))
+    download_path = os.path.join(nltk.data.path[0], resource + ".zip")
+    os.makedirs(os.path.dirname(download_path), exist_ok=True)
+    download_with_retry(resource_url, download_path, checksum, "md5", retry, position)
+    try:
+        with zipfile.ZipFile(download_path, 'r') as zip_ref:
+            if zip_ref.testzip() is not None:
+                raise zipfile.BadZipFile(f"Downloaded file for {resource} is not a valid ZIP file.")
+            zip_ref.extractall(os.path.dirname(download_path))
+    finally:
+        os.remove(download_path)
+
+
+def nltk_resources(resources, mirror=None, workers=4):
+    fetch_resources(nltk_resources=resources, mirror=mirror, workers=workers)
+
+
+def mirror_checksums(folder):
+    # file name -> sha256 from a SHA256SUMS file written by sha256sum
+    checksums = dict()
+    sums = os.path.join(folder, "SHA256SUMS")
+    if os.path.exists(sums):
+        with open(sums, "r", encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    checksum, name = line.split(maxsplit=1)
+                    checksums[name.strip().lstrip("*")] = checksum
+    return checksums
+
+
+def spacy_get_model_info(model, mirror=None):
+    mirror = mirror or _mirror
+    if mirror:
+        folder = local_path(join_location(mirror, "spacy_models"))
+        if folder is None:
+            raise ValueError(f"Spacy models can only be installed from a local mirror, not {mirror}")
+
+        def version(name):
+            try:
+                return Version(name[len(model) + 1:].split("-")[0].removesuffix(".tar.gz"))
+            except InvalidVersion:
+                return Version("0")
+
+        names = [
+            name for name in os.listdir(folder)
+            if name.startswith(f"{model}-") and name.endswith((".whl", ".tar.gz"))
+        ]
+        if not names:
+            raise ValueError(f"Spacy Model '{model}' not found in {folder}.")
+        name = max(names, key=version)
+        return {
+            'url': os.path.join(folder, name),
+            'version': str(version(name)),
+            'sha256': mirror_checksums(folder).get(name)
+        }
+
+    base_url = "https://api.github.com/repos/explosion/spacy-models/releases"
+    response = requests.get(base_url, timeout=60)
+    releases = response.json()
+    for release in releases:
+        assets = release.get('assets', [])
+        for asset in assets:
+            if model in asset['name']:
+                digest = asset.get('digest') or ""
+                return {
+                    'url': asset['browser_download_url'],
+                    'version': release['tag_name'],
+                    'sha256': digest.removeprefix("sha256:") if digest.startswith("sha256:") else None
+                }
+    raise ValueError(f"Spacy Model '{model}' not found in the releases.")
+
+
+def spacy_download_model(model, retry=3, mirror=None, position=0):
+    model_info = spacy_get_model_info(model, mirror)
+    download_url = model_info['url']
+    # models in a local mirror are installed in place
+    file_name = local_path(download_url)
+    downloaded = file_name is None
+    if downloaded:
+        file_name = os.path.basename(urlsplit(download_url).path)
+        download_with_retry(download_url, file_name, model_info['sha256'], "sha256", retry, position)
+    else:
+        verify_checksum(file_name, model_info['sha256'], "sha256")
+
+    print(f"Installing the spacy model {model}...")
+    try:
+        with _pip_lock:
+            subprocess.run([sys.executable, "-m", "pip", "install", file_name], check=True)
+    finally:
+        if downloaded:
+            os.remove(file_name)
+
+
+def spacy_model_installed(model):
+    # answered from the package metadata (or the model directory) without loading the model
+    if os.path.isdir(model):
+        return os.path.exists(os.path.join(model, "meta.json"))
+    try:
+        importlib.metadata.distribution(model)
+        return True
+    except importlib.metadata.PackageNotFoundError:
+        return False
+
+
+def spacy_resource(resource, mirror=None):
+    fetch_resources(spacy_models=[resource], mirror=mirror)
+
+
+def fetch_resources(nltk_resources=(), spacy_models=(), mirror=None, workers=4):
+    # everything that is missing is fetched at the same time, each download with its own progress bar
+    jobs = [
+        (nltk_download_resource, resource) for resource in nltk_resources if not nltk_resource_exists(resource)
+    ] + [
+        (spacy_download_model, model) for model in spacy_models if not spacy_model_installed(model)
+    ]
+    for _, resource in jobs:
+        print(f"Downloading {resource}:")
+    if not jobs:
+        return
+    # workers raise, the main thread reports every failure and stops once all downloads have finished
+    failed = []
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {
+            executor.submit(download, resource, mirror=mirror, position=position): resource
+            for position, (download, resource) in enumerate(jobs)
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Failed to download {futures[future]}: {e}")
+                failed.append(futures[future])
+    print("\n")
+    # model packages installed by pip while this process runs
+    importlib.invalidate_caches()
+    if failed:
+        sys.exit(f"Could not download {', '.join(failed)}; rerun to resume the partial downloads")
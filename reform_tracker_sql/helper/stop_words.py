@@ -0,0 +1,191 @@
+from functools import lru_cache
+
+additional_stop_words = {
+    "government",
+    "recommendation",
+    "finding",
+    "policy",
+    "public",
+    "economy",
+    "economic",
+    "growth",
+    "increase",
+    "reduce",
+    "implement",
+    "reform",
+    "improve",
+    "system",
+    "cost",
+    "support",
+    "high",
+    "low",
+    "risk",
+    "ensure",
+    "maintain",
+    "continue",
+    "develop",
+    "service",
+    "new",
+    "programme",
+    "spending",
+    "sector",
+    "price",
+    "level",
+    "bank",
+    "fiscal",
+    "monetary",
+    "inflation",
+    "competition",
+    "firm",
+    "long",
+    "term",
+    "year",
+    "present",
+    "ha",
+    "small",
+    "large",
+    "market",
+    "potential",
+    "one",
+    "great",
+    "greater",
+    "lower",
+    "third",
+    "job",
+    "employment",
+    "governance",
+    "achieve",
+    "training",
+    "many",
+    "challenge",
+    "central",
+    "use",
+    "rate",
+    "pay",
+    "likely",
+    "tax",
+    "currency",
+    "special",
+    "labour",
+    "lack",
+    "social",
+    "allow",
+    "scheme",
+    "personal",
+    "time",
+    "income",
+    "base",
+    "exemption",
+    "rule",
+    "severe",
+    "misconduct",
+    "governor",
+    "financial",
+    "target",
+    "extend",
+    "keep",
+    "content",
+    "active",
+    "barrier",
+    "early",
+    "scale",
+    "rigid",
+    "benefit",
+    "wa",
+    "imf",
+    "share",
+    "additional",
+    "undermine",
+    "regime",
+    "individual",
+    "undertake",
+    "dismissal",
+    "limit",
+    "adhere",
+    "provincial",
+    "general",
+    "entry",
+    "formal",
+    "administrative",
+    "condition",
+    "office",
+    "impact",
+    "drop",
+    "informal",
+    "force",
+    "capital",
+    "reversal",
+    "unfair",
+    "operate",
+    "currently",
+    "smaller",
+    "bolster",
+    "vocational",
+    "merge",
+    "non",
+    "input",
+    "wide",
+    "intermediate",
+    "rationalise",
+    "province",
+    "review",
+    "pursue",
+    "surprise",
+    "vet",
+    "regulatory",
+    "temporary",
+    "direction",
+    "remove",
+    "operational",
+    "reduction",
+    "space",
+    "line",
+    "transfer",
+    "deteriorate",
+    "indicator",
+    "deduction",
+    "temporarily",
+    "adequate",
+    "type",
+    "alt",
+    "transfer",
+    "line",
+    "raise",
+    "need",
+    "remain",
+    "measure",
+    "include",
+    "introduce",
+    "private",
+    "country",
+    "state",
+    "finance",
+    "consider",
+    "housing",
+    "quality",
+    "relatively",
+    "worker",
+    "local",
+    "address",
+    "well",
+    "current",
+    "oecd",
+    "access",
+    "gdp",
+    "student",
+    "teacher",
+    "plan",
+    "japan",
+    "australia",
+    "argentina"
+}
+
+
+@lru_cache(maxsize=None)
+def get_stop_words():
+    # NLTK's English list plus additional_stop_words, read from the NLTK data on first use instead of at import
+    from nltk.corpus import stopwords
+    stop_words = set(stopwords.words("english"))
+    stop_words.update(additional_stop_words)
+    stop_words.discard("present")
+    return frozenset(stop_words)
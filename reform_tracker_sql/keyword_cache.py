@@ -0,0 +1,124 @@
+import hashlib
+import json
+import sqlite3
+import time
+
+
+class KeywordCache:
+    # on-disk text -> keywords store; entries are namespaced by a fingerprint of everything
+    # that changes the extracted keywords (spaCy model and version, pipeline, filter version, stop words)
+    def __init__(self, path: str, fingerprint: str, max_entries: int = 1000000, commit_every: int = 1000,
+                 touch_after: float = 86400.0):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.max_entries = max_entries
+        self.commit_every = commit_every
+        # hits only move last_used forward when it is older than this many seconds, so a rerun over the
+        # same texts does not rewrite every entry
+        self.touch_after = touch_after
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._pending_writes = 0
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS keywords (key TEXT PRIMARY KEY, keywords TEXT NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS keywords_last_used ON keywords (last_used)")
+        # counted once here and then kept up to date by put() and evict()
+        self._entries = self._connection.execute("SELECT COUNT(*) FROM keywords").fetchone()[0]
+        # key -> last_used of hits, written together by flush()
+        self._touched = dict()
+
+    @staticmethod
+    def make_fingerprint(*parts):
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(str(part).encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def key(self, text: str):
+        return hashlib.sha256(f"{self.fingerprint}\0{text}".encode("utf-8")).hexdigest()
+
+    def get(self, text: str):
+        key = self.key(text)
+        row = self._connection.execute("SELECT keywords, last_used FROM keywords WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        now = time.time()
+        if now - row[1] >= self.touch_after:
+            self._touched[key] = now
+            if len(self._touched) >= self.commit_every:
+                self.flush()
+        return json.loads(row[0])
+
+    def put(self, text: str, keywords: list):
+        key = self.key(text)
+        values = (json.dumps(keywords), time.time())
+        cursor = self._connection.execute(
+            "INSERT OR IGNORE INTO keywords (key, keywords, last_used) VALUES (?, ?, ?)", (key, *values)
+        )
+        if cursor.rowcount:
+            self._entries += 1
+        else:
+            self._connection.execute("UPDATE keywords SET keywords = ?, last_used = ? WHERE key = ?", (*values, key))
+        self._touched.pop(key, None)
+        self._written()
+
+    def evict(self):
+        if self._entries <= self.max_entries:
+            return 0
+        # drop the least recently used entries down to 90% of the limit
+        excess = self._entries - int(self.max_entries * 0.9)
+        excess = self._connection.execute(
+            "DELETE FROM keywords WHERE key IN (SELECT key FROM keywords ORDER BY last_used ASC LIMIT ?)", (excess,)
+        ).rowcount
+        self._connection.commit()
+        self._entries -= excess
+        self.evictions += excess
+        return excess
+
+    def flush(self):
+        if self._touched:
+            self._connection.executemany(
+                "UPDATE keywords SET last_used = ? WHERE key = ?",
+                [(last_used, key) for key, last_used in self._touched.items()]
+            )
+            self._touched.clear()
+        self._connection.commit()
+        self._pending_writes = 0
+        self.evict()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": self._entries
+        }
+
+    def close(self):
+        self.flush()
+        self._connection.close()
+
+    def _written(self):
+        self._pending_writes += 1
+        if self._pending_writes >= self.commit_every:
+            self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __repr__(self):
+        return f"KeywordCache: {self.path}\n{self.stats()}"
+
+    def __str__(self):
+        return f"KeywordCache: {self.path}\n{self.stats()}"
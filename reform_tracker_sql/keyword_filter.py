@@ -0,0 +1,94 @@
+import re
+import string
+
+from spacy.parts_of_speech import IDS
+
+# part of the keyword cache fingerprint: bump it whenever a change to the rules below or to
+# helper.nlp.split_sentences changes which keywords come out, so cached keywords are not reused
+KEYWORD_FILTER_VERSION = 1
+
+_excluded_suffixes = ("ing", "en", "ed", "ly", "ry", "es")
+_brackets = re.compile(r'^[\[\]{}()<>]$')
+_punctuation_and_symbols = frozenset(string.punctuation)
+
+
+def keep_text(text):
+    # the checks that only depend on the token text, decided once per lexeme by spaCy itself
+    return not (
+        text.endswith(_excluded_suffixes)
+        or text in _punctuation_and_symbols
+        or text.isdigit()
+        or _brackets.match(text)
+    )
+
+
+def text_flag(vocab):
+    # registers keep_text as a lexeme flag, None when all 63 flag bits of the vocab are taken
+    try:
+        return vocab.add_flag(keep_text)
+    except ValueError:
+        return None
+
+
+class KeywordFilter:
+    # filter_keywords compiled for one vocab and one stop-word set: the text checks are a lexeme flag,
+    # parts of speech are compared as ids and every other decision is memoized per word, POS and lemma.
+    # add_flag walks the whole vocab and its bits are never freed, so a filter for the same vocab with other
+    # stop words should be given the flag of the previous one
+    excluded_tags = ("DET", "ADP", "CCONJ", "SCONJ")
+
+    def __init__(self, vocab, stop_words, flag=None):
+        self.vocab = vocab
+        self.stop_words = stop_words
+        self.flag = flag if flag is not None else text_flag(vocab)
+        self.excluded_pos = frozenset(IDS[tag] for tag in self.excluded_tags)
+        # (orth, pos, lemma) hashes -> lowercased lemma to keep, or None to drop; the lemma is part of the key
+        # because the lemmatizer can still tell two occurrences of the same word and POS apart by morphology
+        self._decisions = dict()
+        self.tokens = 0
+        self.lexeme_drops = 0
+        self.misses = 0
+
+    def _decide(self, token, key):
+        self.misses += 1
+        keyword = None
+        # without a flag the text checks are memoized here together with the rest
+        keep = self.flag is not None or (keep_text(token.text) and not token.is_stop)
+        if keep and token.pos not in self.excluded_pos:
+            lemma = token.lemma_.lower()
+            if lemma not in self.stop_words:
+                keyword = lemma
+        self._decisions[key] = keyword
+        return keyword
+
+    def __call__(self, doc):
+        keywords = []
+        flag = self.flag
+        decisions = self._decisions
+        lexeme_drops = 0
+        for token in doc:
+            # decided once per lexeme by spaCy, no memo lookup needed
+            if flag is not None and (not token.check_flag(flag) or token.is_stop):
+                lexeme_drops += 1
+                continue
+            key = (token.orth, token.pos, token.lemma)
+            keyword = decisions[key] if key in decisions else self._decide(token, key)
+            if keyword is not None:
+                keywords.append(keyword)
+        self.tokens += len(doc)
+        self.lexeme_drops += lexeme_drops
+        return keywords
+
+    def stats(self):
+        # hits and misses are lookups of the (orth, pos, lemma) memo; tokens the lexeme flag or is_stop
+        # dropped never reach it and are counted apart
+        lookups = self.tokens - self.lexeme_drops
+        hits = lookups - self.misses
+        return {
+            "tokens": self.tokens,
+            "lexeme_drops": self.lexeme_drops,
+            "hits": hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "entries": len(self._decisions)
+        }
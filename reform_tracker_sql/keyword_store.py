@@ -0,0 +1,74 @@
+import os
+import shutil
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from helper import extract_countries
+
+# keyword columns are stored as token lists, Parquet dictionary-encodes the tokens per column chunk
+keyword_columns = ["findings", "recommendations", "all"]
+count_columns = ["findings_count", "recommendations_count", "all_terms_count", "year_entries"]
+_partitioning = ds.partitioning(pa.schema([("year", pa.int32())]), flavor="hive")
+
+
+def write_keyword_store(df, path):
+    data = {
+        "position": pa.array(range(len(df)), type=pa.int32()),
+        "country": pa.array(df["country"].tolist()).dictionary_encode(),
+        "year": pa.array(df["year"].astype(int).tolist(), type=pa.int32()),
+    }
+    for column in keyword_columns:
+        data[column] = pa.array(
+            [text.split(" ") if text else [] for text in df[column]], type=pa.list_(pa.string())
+        )
+    for column in count_columns:
+        data[column] = pa.array(df[column].tolist(), type=pa.int64())
+    table = pa.table(data)
+
+    # written next to the old store and swapped in, so readers never see a half written store
+    temporary = f"{path}.tmp"
+    shutil.rmtree(temporary, ignore_errors=True)
+    ds.write_dataset(
+        table, temporary, format="parquet", partitioning=_partitioning,
+        file_options=ds.ParquetFileFormat().make_write_options(use_dictionary=True, compression="zstd")
+    )
+    previous = f"{path}.old"
+    # left behind by a swap that was interrupted, os.replace cannot move a directory onto it
+    shutil.rmtree(previous, ignore_errors=True)
+    if os.path.exists(path):
+        os.replace(path, previous)
+    os.replace(temporary, path)
+    shutil.rmtree(previous, ignore_errors=True)
+
+
+def load_keyword_store(path, columns=None, start_year=None, end_year=None, countries=None, as_text=True):
+    # columns and the year/country predicates are pushed down to the Parquet scan, so only the
+    # requested year partitions and columns are read; country and year are always returned
+    columns = list(columns) if columns is not None else keyword_columns + count_columns
+    dataset = ds.dataset(
+        path, format=ds.ParquetFileFormat(
+            read_options={"dictionary_columns": [f"{column}.list.element" for column in keyword_columns]}
+        ),
+        partitioning=_partitioning
+    )
+
+    condition = None
+    if start_year is not None:
+        condition = ds.field("year") >= start_year
+    if end_year is not None:
+        condition = (ds.field("year") <= end_year) if condition is None else condition & (ds.field("year") <= end_year)
+    countries = extract_countries(countries)
+    if countries:
+        condition = (ds.field("country").isin(countries)) if condition is None \
+            else condition & ds.field("country").isin(countries)
+
+    table = dataset.to_table(columns=["position", "country", "year"] + columns, filter=condition)
+    df = table.to_pandas().sort_values("position").drop(columns="position").reset_index(drop=True)
+    df["country"] = df["country"].astype(str)
+    df["year"] = df["year"].astype(str)
+    if as_text:
+        for column in columns:
+            if column in keyword_columns:
+                df[column] = [" ".join(tokens) for tokens in df[column]]
+    return df
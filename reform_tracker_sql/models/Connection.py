@@ -1,22 +1,63 @@
+import os
+from contextlib import contextmanager
+
 from sqlalchemy import create_engine, Table
 from sqlalchemy.exc import SQLAlchemyError, OperationalError, DBAPIError
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from db_config import DB_USER_NAME, DB_USER_PASSWORD, DB_HOST, DB_PORT, DB_NAME
+from db_config import DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_PRE_PING, DB_POOL_RECYCLE
 
 DATABASE_URL = f"mysql+pymysql://{DB_USER_NAME}:{DB_USER_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 Base = declarative_base()
 
+_engine = None
+_engine_pid = None
+_session_factory = None
 
-def getSession():
-    try:
-        engine = create_engine(DATABASE_URL)
+
+def getEngine():
+    global _engine, _engine_pid, _session_factory
+    if _engine is None:
+        engine = create_engine(
+            DATABASE_URL,
+            poolclass=QueuePool,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_pre_ping=DB_POOL_PRE_PING,
+            pool_recycle=DB_POOL_RECYCLE
+        )
         connection = engine.connect()
         connection.close()
-        session = sessionmaker(bind=engine)
-        return session()
+        _engine = engine
+        _engine_pid = os.getpid()
+        _session_factory = sessionmaker(bind=engine)
+    elif _engine_pid != os.getpid():
+        # forked worker: start a fresh pool without closing the parent's connections
+        _engine.dispose(close=False)
+        _engine_pid = os.getpid()
+    return _engine
+
+
+def getSession():
+    try:
+        getEngine()
+        return _session_factory()
     except (OperationalError, DBAPIError):
         print("Database connection failed")
         exit()
     except Exception as e:
         print(f"Error occurred: {e}")
+
+
+@contextmanager
+def sessionScope():
+    session = getSession()
+    try:
+        yield session
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
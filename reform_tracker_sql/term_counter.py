@@ -0,0 +1,91 @@
+import re
+from collections import Counter
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+
+class TermCounter:
+    # counts every term of a list in one pass over each text. Keyword texts are space-joined tokens and
+    # a term without a space can never match across a token boundary, so per token the number of matches
+    # of all single-word terms is computed once and reused for every later occurrence of that token
+    def __init__(self, terms, whole_tokens: bool = False):
+        self.terms = list(terms)
+        self.whole_tokens = whole_tokens
+        self._single = Counter(term for term in self.terms if " " not in term)
+        self._phrases = Counter(term for term in self.terms if " " in term)
+        alternation = "|".join(re.escape(phrase) for phrase in sorted(self._phrases, key=len, reverse=True))
+        self._phrase_pattern = re.compile(rf"(?<!\S)({alternation})(?!\S)") if self._phrases else None
+        self._weights = {}
+
+    def _weight(self, token):
+        weight = self._weights.get(token)
+        if weight is None:
+            if self.whole_tokens:
+                weight = self._single.get(token, 0)
+            else:
+                weight = sum(token.count(term) * repeat for term, repeat in self._single.items())
+            self._weights[token] = weight
+        return weight
+
+    def _count_phrases(self, text):
+        if not self._phrases:
+            return 0
+        if self.whole_tokens:
+            return sum(self._phrases[match] for match in self._phrase_pattern.findall(text))
+        return sum(text.count(phrase) * repeat for phrase, repeat in self._phrases.items())
+
+    def count(self, text):
+        # substring mode gives the same number as helper.count_terms
+        text = text.lower()
+        return sum(map(self._weight, text.split(" "))) + self._count_phrases(text)
+
+    def count_column(self, texts):
+        counts = np.fromiter((self.count(text) for text in texts), dtype=np.int64, count=len(texts))
+        return pd.Series(counts, index=texts.index) if isinstance(texts, pd.Series) else counts
+
+
+class CategoryCounter:
+    # several term lists counted in the same pass: one split per text, one cached weight tuple per token
+    def __init__(self, categories: dict, whole_tokens: bool = False):
+        self.categories = list(categories)
+        self._counters = [TermCounter(terms, whole_tokens) for terms in categories.values()]
+        self._weights = {}
+
+    def _weight(self, token):
+        weight = self._weights.get(token)
+        if weight is None:
+            weight = tuple(counter._weight(token) for counter in self._counters)
+            self._weights[token] = weight
+        return weight
+
+    def count(self, text):
+        text = text.lower()
+        totals = [counter._count_phrases(text) for counter in self._counters]
+        for token, repeat in Counter(text.split(" ")).items():
+            for index, weight in enumerate(self._weight(token)):
+                if weight:
+                    totals[index] += weight * repeat
+        return totals
+
+    def count_column(self, texts):
+        # (len(texts), len(categories)) matrix of counts
+        counts = np.zeros((len(texts), len(self.categories)), dtype=np.int64)
+        for row, text in enumerate(texts):
+            counts[row] = self.count(text)
+        return counts
+
+
+@lru_cache(maxsize=32)
+def _term_counter(terms, whole_tokens):
+    return TermCounter(terms, whole_tokens)
+
+
+def count_terms_column(texts, related_terms, whole_tokens=False):
+    # counters are kept per term list so their token weights carry over between calls
+    return _term_counter(tuple(related_terms), whole_tokens).count_column(texts)
+
+
+def count_categories_column(texts, categories, whole_tokens=False):
+    return CategoryCounter(categories, whole_tokens).count_column(texts)
@@ -0,0 +1,96 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from helper import extract_countries
+from term_counter import count_categories_column
+from terms import climate_related_terms, gender_related_terms
+
+# the term lists behind the time series charts, keyed by their relevancy name
+default_term_lists = {
+    "climate": climate_related_terms,
+    "gender": gender_related_terms
+}
+
+
+def terms_digest(terms):
+    return hashlib.sha1("\0".join(terms).encode("utf-8")).hexdigest()
+
+
+class TermCube:
+    # relevant-term counts per (term list, country, year) over the "all" keywords, built once after
+    # keyword extraction so a time series for any year range or region is a slice instead of a rescan
+    def __init__(self, names: list, digests: list, countries: np.ndarray, years: np.ndarray,
+                 year_entries: np.ndarray, counts: np.ndarray):
+        self.names = list(names)
+        self.digests = list(digests)
+        self.countries = countries
+        self.years = years
+        self.year_entries = year_entries
+        self.counts = counts
+
+    @classmethod
+    def from_frame(cls, df, term_lists=default_term_lists, column="all"):
+        counts = count_categories_column(df[column], term_lists).T
+        return cls(
+            list(term_lists),
+            [terms_digest(terms) for terms in term_lists.values()],
+            df["country"].to_numpy(dtype=str),
+            df["year"].astype(int).to_numpy(),
+            df["year_entries"].to_numpy(dtype=np.int64),
+            counts
+        )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(f"{path}.npz", allow_pickle=False) as data:
+            return cls(
+                data["names"].tolist(), data["digests"].tolist(), data["countries"], data["years"],
+                data["year_entries"], data["counts"]
+            )
+
+    def save(self, path):
+        with open(f"{path}.npz.tmp", "wb") as file:
+            np.savez_compressed(
+                file, names=np.array(self.names), digests=np.array(self.digests), countries=self.countries,
+                years=self.years, year_entries=self.year_entries, counts=self.counts
+            )
+        os.replace(f"{path}.npz.tmp", f"{path}.npz")
+
+    def has(self, name, terms=None):
+        # a cube built from a different version of the term list must not answer for it
+        if name not in self.names:
+            return False
+        return terms is None or self.digests[self.names.index(name)] == terms_digest(terms)
+
+    def select(self, start_year, end_year, countries=None):
+        mask = (self.years >= start_year) & (self.years <= end_year)
+        countries = extract_countries(countries)
+        if countries:
+            mask &= np.isin(self.countries, countries)
+        return mask
+
+    def ts_frequency(self, name, start_year, end_year, countries=None, dp=2):
+        # same arithmetic as helper.process_ts_frequency, on the precomputed counts
+        mask = self.select(start_year, end_year, countries)
+        relevant_term_count = self.counts[self.names.index(name)][mask]
+        trend_terms = (np.round(relevant_term_count / self.year_entries[mask], dp) * pow(10, dp)).astype(int)
+        df = pd.DataFrame({"year": self.years[mask], "trend_terms": trend_terms})
+        yearly_trends = df.groupby("year")["trend_terms"].agg(["sum", "size"]).reset_index()
+        yearly_trends["trends"] = ((yearly_trends["sum"] / yearly_trends["size"]).round(dp)).astype(int)
+        return yearly_trends[["year", "trends"]]
+
+    def fingerprint(self):
+        digest = hashlib.sha256(json.dumps([self.names, self.digests, self.countries.tolist()]).encode("utf-8"))
+        for part in (self.years, self.year_entries, self.counts):
+            digest.update(part.tobytes())
+        return digest.hexdigest()
+
+    def __repr__(self):
+        return f"TermCube: {len(self.names)} term lists x {len(self.years)} country-years"
+
+    def __str__(self):
+        return f"TermCube: {len(self.names)} term lists x {len(self.years)} country-years"
@@ -0,0 +1,160 @@
+import hashlib
+import json
+import os
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from helper import extract_countries
+from terms import climate_related_terms, economic_reform_terms, environmental_policy_terms
+from terms import gender_related_terms, social_policy_terms
+
+# multi-word terms cannot be recovered from single tokens, so they get their own columns
+default_phrases = sorted({
+    term for terms in (
+        climate_related_terms, economic_reform_terms, environmental_policy_terms,
+        gender_related_terms, social_policy_terms
+    ) for term in terms if " " in term
+})
+
+
+class TermMatrix:
+    # CSR matrix of term counts, one row per (country, year, field) and one column per vocabulary entry
+    fields = ("findings", "recommendations", "all")
+
+    def __init__(self, vocabulary: list, rows: pd.DataFrame, matrix: sparse.csr_matrix, phrases=default_phrases):
+        self.vocabulary = vocabulary
+        self.rows = rows
+        self.matrix = matrix
+        # the phrases that were counted; only those that occur somewhere have a column
+        self.phrases = frozenset(phrases)
+        self.index = {term: column for column, term in enumerate(vocabulary)}
+        self._phrase = np.array([" " in term for term in vocabulary], dtype=bool)
+        # substring term -> (columns, occurrences) over the single-token columns, found once per term
+        self._substrings = dict()
+        self._tokens = None
+
+    @classmethod
+    def from_frame(cls, df, fields=fields, phrases=default_phrases):
+        index = {}
+        rows = []
+        indptr = [0]
+        indices = []
+        data = []
+        for country, year, *texts in zip(df["country"], df["year"], *(df[field] for field in fields)):
+            for field, text in zip(fields, texts):
+                counts = Counter(text.split(" ") if text else [])
+                for phrase in phrases:
+                    occurrences = text.count(phrase)
+                    if occurrences:
+                        counts[phrase] = occurrences
+                for term, count in counts.items():
+                    indices.append(index.setdefault(term, len(index)))
+                    data.append(count)
+                indptr.append(len(indices))
+                rows.append((country, year, field))
+
+        matrix = sparse.csr_matrix(
+            (np.array(data, dtype=np.int32), np.array(indices, dtype=np.int32), np.array(indptr, dtype=np.int64)),
+            shape=(len(rows), len(index))
+        )
+        matrix.sort_indices()
+        return cls(list(index), pd.DataFrame(rows, columns=["country", "year", "field"]), matrix, phrases)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(f"{path}.npz", allow_pickle=False) as data:
+            matrix = sparse.csr_matrix(
+                (data["data"], data["indices"], data["indptr"]), shape=tuple(data["shape"])
+            )
+            rows = pd.DataFrame({
+                "country": data["countries"].tolist(), "year": data["years"].tolist(), "field": data["fields"].tolist()
+            }, columns=["country", "year", "field"])
+            # files saved before the phrases were stored were built from default_phrases
+            phrases = data["phrases"].tolist() if "phrases" in data.files else default_phrases
+            return cls(data["vocabulary"].tolist(), rows, matrix, phrases)
+
+    def save(self, path):
+        # matrix, vocabulary and rows go into one file so they can only be replaced together
+        with open(f"{path}.npz.tmp", "wb") as file:
+            np.savez_compressed(
+                file, data=self.matrix.data, indices=self.matrix.indices, indptr=self.matrix.indptr,
+                shape=np.array(self.matrix.shape, dtype=np.int64), vocabulary=np.array(self.vocabulary, dtype=str),
+                countries=np.array(self.rows["country"].tolist(), dtype=str),
+                years=np.array(self.rows["year"].tolist(), dtype=str),
+                fields=np.array(self.rows["field"].tolist(), dtype=str),
+                phrases=np.array(sorted(self.phrases), dtype=str)
+            )
+        os.replace(f"{path}.npz.tmp", f"{path}.npz")
+
+    def substring_columns(self, term):
+        if term not in self._substrings:
+            if self._tokens is None:
+                self._tokens = np.array([
+                    "" if phrase else token for token, phrase in zip(self.vocabulary, self._phrase)
+                ], dtype=str)
+            occurrences = np.char.count(self._tokens, term)
+            columns = np.flatnonzero(occurrences)
+            self._substrings[term] = (columns, occurrences[columns])
+        return self._substrings[term]
+
+    def term_weights(self, terms, substring=True):
+        # column weights such that matrix @ weights counts the terms in every row; substring=True
+        # matches helper.count_terms (occurrences of each term inside the keywords), otherwise whole tokens;
+        # a multi-word term can only be counted if it was one of the phrases the matrix was built with
+        weights = np.zeros(len(self.vocabulary), dtype=np.int64)
+        for term in terms:
+            if " " in term:
+                if term not in self.phrases:
+                    raise ValueError(
+                        f"Phrase '{term}' was not counted in this TermMatrix, pass it in phrases to from_frame"
+                    )
+                if term in self.index:
+                    weights[self.index[term]] += 1
+            elif substring:
+                columns, occurrences = self.substring_columns(term)
+                weights[columns] += occurrences
+            elif term in self.index:
+                weights[self.index[term]] += 1
+        return weights
+
+    def select(self, field, start_year=None, end_year=None, countries=None):
+        mask = (self.rows["field"] == field).to_numpy()
+        years = self.rows["year"].astype(int)
+        if start_year is not None:
+            mask &= (years >= start_year).to_numpy()
+        if end_year is not None:
+            mask &= (years <= end_year).to_numpy()
+        countries = extract_countries(countries)
+        if countries:
+            mask &= self.rows["country"].isin(countries).to_numpy()
+        return mask
+
+    def term_counts(self, terms, field="all", start_year=None, end_year=None, countries=None, substring=True):
+        mask = self.select(field, start_year, end_year, countries)
+        counts = self.matrix[mask] @ self.term_weights(terms, substring)
+        result = self.rows.loc[mask, ["country", "year"]].reset_index(drop=True)
+        result["relevant_term_count"] = counts
+        return result
+
+    def frequencies(self, field, start_year=None, end_year=None, countries=None):
+        # token -> total count over the selected rows, phrase columns left out
+        totals = np.asarray(self.matrix[self.select(field, start_year, end_year, countries)].sum(axis=0)).ravel()
+        return {
+            self.vocabulary[column]: int(totals[column])
+            for column in np.flatnonzero(totals) if not self._phrase[column]
+        }
+
+    def fingerprint(self):
+        digest = hashlib.sha256(json.dumps([self.vocabulary, self.rows.values.tolist()]).encode("utf-8"))
+        for part in (self.matrix.data, self.matrix.indices, self.matrix.indptr):
+            digest.update(part.tobytes())
+        return digest.hexdigest()
+
+    def __repr__(self):
+        return f"TermMatrix: {self.matrix.shape[0]} rows x {len(self.vocabulary)} terms"
+
+    def __str__(self):
+        return f"TermMatrix: {self.matrix.shape[0]} rows x {len(self.vocabulary)} terms"